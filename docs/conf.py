@@ -25,7 +25,8 @@ else:
 
 ROOT = pathlib.Path(__file__).resolve().parent.parent
 
-PYPROJECT = tomllib.loads(ROOT.joinpath("pyproject.toml").read_text())
+with ROOT.joinpath("pyproject.toml").open("rb") as fin:
+    PYPROJECT = tomllib.load(fin)
 
 COMMIT = subprocess.run(
     ["git", "rev-parse", "--short", "HEAD"],  # noqa: S603, S607
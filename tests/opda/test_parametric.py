@@ -29,15 +29,22 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
                         np.mean(ys),
                         delta=6 * np.std(ys) / n_samples**0.5,
                     )
+                    squared_errors = (ys - dist.mean)**2
                     self.assertAlmostEqual(
                         dist.variance,
-                        np.mean((ys - dist.mean)**2),
-                        delta=6 * np.std((ys - dist.mean)**2) / n_samples**0.5,
+                        np.mean(squared_errors),
+                        delta=6 * np.std(squared_errors) / n_samples**0.5,
                     )
 
     def test___eq__(self):
         bounds = [(-10., -1.), (-1., 0.), (0., 0.), (0., 1.), (1., 10.)]
         cs = [1, 2, 10]
+
+        class QuadraticDistributionSubclass(
+                parametric.QuadraticDistribution,
+        ):
+            pass
+
         for a, b in bounds:
             for c in cs:
                 for convex in [False, True]:
@@ -92,10 +99,6 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
                         )
 
                     # Test (in)equality between instances of different classes.
-                    class QuadraticDistributionSubclass(
-                            parametric.QuadraticDistribution,
-                    ):
-                        pass
                     #   equality
                     self.assertEqual(
                         parametric.QuadraticDistribution(a, b, c, convex),
@@ -260,25 +263,24 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
                     1. / (b - a),
                 )
             # broadcasting
-            for _ in range(7):
-                # 1D array
-                us = self.generator.uniform(0, 1, size=5)
-                self.assertEqual(
-                    dist.pdf(a + us * (b - a)).tolist(),
-                    np.full_like(us, 1. / (b - a)).tolist(),
-                )
-                # 2D array
-                us = self.generator.uniform(0, 1, size=(5, 3))
-                self.assertEqual(
-                    dist.pdf(a + us * (b - a)).tolist(),
-                    np.full_like(us, 1. / (b - a)).tolist(),
-                )
-                # 3D array
-                us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                self.assertEqual(
-                    dist.pdf(a + us * (b - a)).tolist(),
-                    np.full_like(us, 1. / (b - a)).tolist(),
-                )
+            # 1D array
+            us = self.generator.uniform(0, 1, size=35)
+            self.assertEqual(
+                dist.pdf(a + us * (b - a)).tolist(),
+                np.full_like(us, 1. / (b - a)).tolist(),
+            )
+            # 2D array
+            us = self.generator.uniform(0, 1, size=(35, 3))
+            self.assertEqual(
+                dist.pdf(a + us * (b - a)).tolist(),
+                np.full_like(us, 1. / (b - a)).tolist(),
+            )
+            # 3D array
+            us = self.generator.uniform(0, 1, size=(35, 3, 2))
+            self.assertEqual(
+                dist.pdf(a + us * (b - a)).tolist(),
+                np.full_like(us, 1. / (b - a)).tolist(),
+            )
 
         # Test outside of the distribution's support.
         for a, b, c in [(0., 1., 1), (0., 1., 2)]:
@@ -333,25 +335,24 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
                     n / 5.,
                 )
             # broadcasting
-            for _ in range(7):
-                # 1D array
-                us = self.generator.uniform(0, 1, size=5)
-                self.assertEqual(
-                    dist.cdf(a + us * (b - a)).tolist(),
-                    us.tolist(),
-                )
-                # 2D array
-                us = self.generator.uniform(0, 1, size=(5, 3))
-                self.assertEqual(
-                    dist.cdf(a + us * (b - a)).tolist(),
-                    us.tolist(),
-                )
-                # 3D array
-                us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                self.assertEqual(
-                    dist.cdf(a + us * (b - a)).tolist(),
-                    us.tolist(),
-                )
+            # 1D array
+            us = self.generator.uniform(0, 1, size=35)
+            self.assertEqual(
+                dist.cdf(a + us * (b - a)).tolist(),
+                us.tolist(),
+            )
+            # 2D array
+            us = self.generator.uniform(0, 1, size=(35, 3))
+            self.assertEqual(
+                dist.cdf(a + us * (b - a)).tolist(),
+                us.tolist(),
+            )
+            # 3D array
+            us = self.generator.uniform(0, 1, size=(35, 3, 2))
+            self.assertEqual(
+                dist.cdf(a + us * (b - a)).tolist(),
+                us.tolist(),
+            )
 
         # Test outside of the distribution's support.
         for a, b, c in [(0., 1., 1), (0., 1., 2)]:
@@ -374,16 +375,15 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
                 self.assertTrue(np.isscalar(dist.ppf(n / 5.)))
                 self.assertEqual(dist.ppf(n / 5.), a)
             # broadcasting
-            for _ in range(7):
-                # 1D array
-                us = self.generator.uniform(0, 1, size=5)
-                self.assertEqual(dist.ppf(us).tolist(), [a] * 5)
-                # 2D array
-                us = self.generator.uniform(0, 1, size=(5, 3))
-                self.assertEqual(dist.ppf(us).tolist(), [[a] * 3] * 5)
-                # 3D array
-                us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                self.assertEqual(dist.ppf(us).tolist(), [[[a] * 2] * 3] * 5)
+            # 1D array
+            us = self.generator.uniform(0, 1, size=35)
+            self.assertEqual(dist.ppf(us).tolist(), [a] * 35)
+            # 2D array
+            us = self.generator.uniform(0, 1, size=(35, 3))
+            self.assertEqual(dist.ppf(us).tolist(), [[a] * 3] * 35)
+            # 3D array
+            us = self.generator.uniform(0, 1, size=(35, 3, 2))
+            self.assertEqual(dist.ppf(us).tolist(), [[[a] * 2] * 3] * 35)
 
         # Test when a != b.
 
@@ -396,30 +396,36 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
                 # When c = 2, the distribution is uniform.
                 self.assertAlmostEqual(dist.ppf(n / 5.), a + (n / 5.) * (b - a))
             # broadcasting
-            for _ in range(7):
-                # 1D array
-                us = self.generator.uniform(0, 1, size=5)
-                self.assertEqual(
-                    dist.ppf(us).tolist(),
-                    (a + us * (b - a)).tolist(),
-                )
-                # 2D array
-                us = self.generator.uniform(0, 1, size=(5, 3))
-                self.assertEqual(
-                    dist.ppf(us).tolist(),
-                    (a + us * (b - a)).tolist(),
-                )
-                # 3D array
-                us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                self.assertEqual(
-                    dist.ppf(us).tolist(),
-                    (a + us * (b - a)).tolist(),
-                )
+            # 1D array
+            us = self.generator.uniform(0, 1, size=35)
+            self.assertEqual(
+                dist.ppf(us).tolist(),
+                (a + us * (b - a)).tolist(),
+            )
+            # 2D array
+            us = self.generator.uniform(0, 1, size=(35, 3))
+            self.assertEqual(
+                dist.ppf(us).tolist(),
+                (a + us * (b - a)).tolist(),
+            )
+            # 3D array
+            us = self.generator.uniform(0, 1, size=(35, 3, 2))
+            self.assertEqual(
+                dist.ppf(us).tolist(),
+                (a + us * (b - a)).tolist(),
+            )
 
     def test_quantile_tuning_curve(self):
         a, b = 0., 1.
         for c in [1, 10]:
             for convex in [False, True]:
+                dist = parametric.QuadraticDistribution(
+                    a,
+                    b,
+                    c,
+                    convex=convex,
+                )
+                yss = dist.sample((2_000, 5))
                 for minimize in [None, False, True]:
                     # NOTE: When minimize is None, default to convex.
                     expect_minimize = (
@@ -427,14 +433,6 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
                         if minimize is not None else
                         convex
                     )
-
-                    dist = parametric.QuadraticDistribution(
-                        a,
-                        b,
-                        c,
-                        convex=convex,
-                    )
-                    yss = dist.sample((2_000, 5))
                     curve = np.median(
                         np.minimum.accumulate(yss, axis=1)
                         if expect_minimize else
@@ -581,59 +579,32 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
                     ))
 
                     # Test ns <= 0.
-                    with self.assertRaises(ValueError):
-                        dist.quantile_tuning_curve(
-                            0,
-                            q=0.5,
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.quantile_tuning_curve(
-                            -1,
-                            q=0.5,
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.quantile_tuning_curve(
-                            [0],
-                            q=0.5,
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.quantile_tuning_curve(
-                            [-2],
-                            q=0.5,
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.quantile_tuning_curve(
-                            [0, 1],
-                            q=0.5,
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.quantile_tuning_curve(
-                            [-2, 1],
-                            q=0.5,
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.quantile_tuning_curve(
-                            [[0], [1]],
-                            q=0.5,
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.quantile_tuning_curve(
-                            [[-2], [1]],
-                            q=0.5,
-                            minimize=minimize,
-                        )
+                    for ns in [
+                            # scalar
+                            0, -1,
+                            # 1D array
+                            [0], [-2], [0, 1], [-2, 1],
+                            # 2D array
+                            [[0], [1]], [[-2], [1]],
+                    ]:
+                        with self.assertRaises(ValueError):
+                            dist.quantile_tuning_curve(
+                                ns,
+                                q=0.5,
+                                minimize=minimize,
+                            )
 
     def test_average_tuning_curve(self):
         a, b = 0., 1.
         for c in [1, 10]:
             for convex in [False, True]:
+                dist = parametric.QuadraticDistribution(
+                    a,
+                    b,
+                    c,
+                    convex=convex,
+                )
+                yss = dist.sample((2_000, 5))
                 for minimize in [None, False, True]:
                     # NOTE: When minimize is None, default to convex.
                     expect_minimize = (
@@ -641,14 +612,6 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
                         if minimize is not None else
                         convex
                     )
-
-                    dist = parametric.QuadraticDistribution(
-                        a,
-                        b,
-                        c,
-                        convex=convex,
-                    )
-                    yss = dist.sample((2_000, 5))
                     curve = np.mean(
                         np.minimum.accumulate(yss, axis=1)
                         if expect_minimize else
@@ -774,56 +737,29 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
                     ))
 
                     # Test ns <= 0.
-                    with self.assertRaises(ValueError):
-                        dist.average_tuning_curve(
-                            0,
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.average_tuning_curve(
-                            -1,
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.average_tuning_curve(
-                            [0],
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.average_tuning_curve(
-                            [-2],
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.average_tuning_curve(
-                            [0, 1],
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.average_tuning_curve(
-                            [-2, 1],
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.average_tuning_curve(
-                            [[0], [1]],
-                            minimize=minimize,
-                        )
-                    with self.assertRaises(ValueError):
-                        dist.average_tuning_curve(
-                            [[-2], [1]],
-                            minimize=minimize,
-                        )
+                    for ns in [
+                            # scalar
+                            0, -1,
+                            # 1D array
+                            [0], [-2], [0, 1], [-2, 1],
+                            # 2D array
+                            [[0], [1]], [[-2], [1]],
+                    ]:
+                        with self.assertRaises(ValueError):
+                            dist.average_tuning_curve(
+                                ns,
+                                minimize=minimize,
+                            )
 
     def test_estimate_initial_parameters_and_bounds(self):
         # Test when a = b.
         a, b = 0., 0.
         for c in [1, 10]:
             for convex in [False, True]:
+                ys = parametric.QuadraticDistribution(
+                    a, b, c, convex=convex,
+                ).sample(5)
                 for fraction in [0.5, 1.]:
-                    ys = parametric.QuadraticDistribution(
-                        a, b, c, convex=convex,
-                    ).sample(5)
                     init_params, bounds = parametric.QuadraticDistribution\
                         .estimate_initial_parameters_and_bounds(
                             ys,
@@ -843,10 +779,10 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
         # Test when a != b.
         for a, b, c in [(0., 1., 1), (-1., 1., 2)]:
             for convex in [False, True]:
+                ys = parametric.QuadraticDistribution(
+                    a, b, c, convex=convex,
+                ).sample(5_000)
                 for fraction in [0.5, 1.]:
-                    ys = parametric.QuadraticDistribution(
-                        a, b, c, convex=convex,
-                    ).sample(5_000)
                     init_params, bounds = parametric.QuadraticDistribution\
                         .estimate_initial_parameters_and_bounds(
                             ys,
@@ -1151,10 +1087,10 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
                     self.assertEqual(dist.ppf(1. + 1e-12), b)
 
     def test_quantile_tuning_curve_minimize_is_dual_to_maximize(self):
+        ns = np.arange(1, 17)
+
         for a, b, c in [(0., 1., 1), (-1., 10., 2)]:
             for convex in [False, True]:
-                ns = np.arange(1, 17)
-
                 self.assertTrue(np.allclose(
                     parametric
                       .QuadraticDistribution(a, b, c, convex=convex)
@@ -1173,10 +1109,10 @@ class QuadraticDistributionTestCase(testcases.RandomTestCase):
                 ))
 
     def test_average_tuning_curve_minimize_is_dual_to_maximize(self):
+        ns = np.arange(1, 17)
+
         for a, b, c in [(0., 1., 1), (-1., 10., 2)]:
             for convex in [False, True]:
-                ns = np.arange(1, 17)
-
                 self.assertTrue(np.allclose(
                     parametric
                       .QuadraticDistribution(a, b, c, convex=convex)
@@ -1218,16 +1154,23 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                             np.mean(ys),
                             delta=6*np.std(ys)/n_samples**0.5,
                         )
+                        squared_errors = (ys - dist.mean)**2
                         self.assertAlmostEqual(
                             dist.variance,
-                            np.mean((ys - dist.mean)**2),
-                            delta=6*np.std((ys - dist.mean)**2)/n_samples**0.5,
+                            np.mean(squared_errors),
+                            delta=6*np.std(squared_errors)/n_samples**0.5,
                         )
 
     def test___eq__(self):
         bounds = [(-10., -1.), (-1., 0.), (0., 0.), (0., 1.), (1., 10.)]
         cs = [1, 2, 10]
         os = [1e-6, 1e-3, 1e0, 1e3]
+
+        class NoisyQuadraticDistributionSubclass(
+                parametric.NoisyQuadraticDistribution,
+        ):
+            pass
+
         for a, b in bounds:
             for c in cs:
                 for o in os:
@@ -1321,10 +1264,6 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
 
                         # Test (in)equality between instances of
                         # different classes.
-                        class NoisyQuadraticDistributionSubclass(
-                                parametric.NoisyQuadraticDistribution,
-                        ):
-                            pass
                         #   equality
                         self.assertEqual(
                             parametric.NoisyQuadraticDistribution(
@@ -1581,25 +1520,24 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                     ),
                 )
             # broadcasting
-            for _ in range(7):
-                # 1D array
-                us = self.generator.uniform(0, 1, size=5)
-                self.assertEqual(
-                    dist.pdf(a - 6*o + us * 12*o).tolist(),
-                    utils.normal_pdf(a - 6*o + us * 12*o).tolist(),
-                )
-                # 2D array
-                us = self.generator.uniform(0, 1, size=(5, 3))
-                self.assertEqual(
-                    dist.pdf(a - 6*o + us * 12*o).tolist(),
-                    utils.normal_pdf(a - 6*o + us * 12*o).tolist(),
-                )
-                # 3D array
-                us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                self.assertEqual(
-                    dist.pdf(a - 6*o + us * 12*o).tolist(),
-                    utils.normal_pdf(a - 6*o + us * 12*o).tolist(),
-                )
+            # 1D array
+            us = self.generator.uniform(0, 1, size=35)
+            self.assertEqual(
+                dist.pdf(a - 6*o + us * 12*o).tolist(),
+                utils.normal_pdf(a - 6*o + us * 12*o).tolist(),
+            )
+            # 2D array
+            us = self.generator.uniform(0, 1, size=(35, 3))
+            self.assertEqual(
+                dist.pdf(a - 6*o + us * 12*o).tolist(),
+                utils.normal_pdf(a - 6*o + us * 12*o).tolist(),
+            )
+            # 3D array
+            us = self.generator.uniform(0, 1, size=(35, 3, 2))
+            self.assertEqual(
+                dist.pdf(a - 6*o + us * 12*o).tolist(),
+                utils.normal_pdf(a - 6*o + us * 12*o).tolist(),
+            )
 
         # Test when a != b and o = 0.
 
@@ -1618,25 +1556,24 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                     1. / (b - a),
                 )
             # broadcasting
-            for _ in range(7):
-                # 1D array
-                us = self.generator.uniform(0, 1, size=5)
-                self.assertEqual(
-                    dist.pdf(a + us * (b - a)).tolist(),
-                    np.full_like(us, 1. / (b - a)).tolist(),
-                )
-                # 2D array
-                us = self.generator.uniform(0, 1, size=(5, 3))
-                self.assertEqual(
-                    dist.pdf(a + us * (b - a)).tolist(),
-                    np.full_like(us, 1. / (b - a)).tolist(),
-                )
-                # 3D array
-                us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                self.assertEqual(
-                    dist.pdf(a + us * (b - a)).tolist(),
-                    np.full_like(us, 1. / (b - a)).tolist(),
-                )
+            # 1D array
+            us = self.generator.uniform(0, 1, size=35)
+            self.assertEqual(
+                dist.pdf(a + us * (b - a)).tolist(),
+                np.full_like(us, 1. / (b - a)).tolist(),
+            )
+            # 2D array
+            us = self.generator.uniform(0, 1, size=(35, 3))
+            self.assertEqual(
+                dist.pdf(a + us * (b - a)).tolist(),
+                np.full_like(us, 1. / (b - a)).tolist(),
+            )
+            # 3D array
+            us = self.generator.uniform(0, 1, size=(35, 3, 2))
+            self.assertEqual(
+                dist.pdf(a + us * (b - a)).tolist(),
+                np.full_like(us, 1. / (b - a)).tolist(),
+            )
 
         # Test outside of the distribution's support.
         for a, b, c, o in [(0., 1., 1, 0.), (0., 1., 2, 0.)]:
@@ -1673,34 +1610,33 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                             ) >= 0.,
                         ))
                     # broadcasting
-                    for _ in range(7):
-                        # 1D array
-                        us = self.generator.uniform(0, 1, size=5)
-                        self.assertEqual(
-                            dist.pdf(a - 6*o + us * 12*o).shape,
-                            us.shape,
-                        )
-                        self.assertTrue(np.all(
-                            dist.pdf(a - 6*o + us * 12*o) >= 0.,
-                        ))
-                        # 2D array
-                        us = self.generator.uniform(0, 1, size=(5, 3))
-                        self.assertEqual(
-                            dist.pdf(a - 6*o + us * 12*o).shape,
-                            us.shape,
-                        )
-                        self.assertTrue(np.all(
-                            dist.pdf(a - 6*o + us * 12*o) >= 0.,
-                        ))
-                        # 3D array
-                        us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                        self.assertEqual(
-                            dist.pdf(a - 6*o + us * 12*o).shape,
-                            us.shape,
-                        )
-                        self.assertTrue(np.all(
-                            dist.pdf(a - 6*o + us * 12*o) >= 0.,
-                        ))
+                    # 1D array
+                    us = self.generator.uniform(0, 1, size=35)
+                    self.assertEqual(
+                        dist.pdf(a - 6*o + us * 12*o).shape,
+                        us.shape,
+                    )
+                    self.assertTrue(np.all(
+                        dist.pdf(a - 6*o + us * 12*o) >= 0.,
+                    ))
+                    # 2D array
+                    us = self.generator.uniform(0, 1, size=(35, 3))
+                    self.assertEqual(
+                        dist.pdf(a - 6*o + us * 12*o).shape,
+                        us.shape,
+                    )
+                    self.assertTrue(np.all(
+                        dist.pdf(a - 6*o + us * 12*o) >= 0.,
+                    ))
+                    # 3D array
+                    us = self.generator.uniform(0, 1, size=(35, 3, 2))
+                    self.assertEqual(
+                        dist.pdf(a - 6*o + us * 12*o).shape,
+                        us.shape,
+                    )
+                    self.assertTrue(np.all(
+                        dist.pdf(a - 6*o + us * 12*o) >= 0.,
+                    ))
 
     def test_cdf(self):
         # Test when a = b and o = 0.
@@ -1760,25 +1696,24 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                     ),
                 )
             # broadcasting
-            for _ in range(7):
-                # 1D array
-                us = self.generator.uniform(0, 1, size=5)
-                self.assertEqual(
-                    dist.cdf(a - 6*o + us * 12*o).tolist(),
-                    utils.normal_cdf(a - 6*o + us * 12*o).tolist(),
-                )
-                # 2D array
-                us = self.generator.uniform(0, 1, size=(5, 3))
-                self.assertEqual(
-                    dist.cdf(a - 6*o + us * 12*o).tolist(),
-                    utils.normal_cdf(a - 6*o + us * 12*o).tolist(),
-                )
-                # 3D array
-                us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                self.assertEqual(
-                    dist.cdf(a - 6*o + us * 12*o).tolist(),
-                    utils.normal_cdf(a - 6*o + us * 12*o).tolist(),
-                )
+            # 1D array
+            us = self.generator.uniform(0, 1, size=35)
+            self.assertEqual(
+                dist.cdf(a - 6*o + us * 12*o).tolist(),
+                utils.normal_cdf(a - 6*o + us * 12*o).tolist(),
+            )
+            # 2D array
+            us = self.generator.uniform(0, 1, size=(35, 3))
+            self.assertEqual(
+                dist.cdf(a - 6*o + us * 12*o).tolist(),
+                utils.normal_cdf(a - 6*o + us * 12*o).tolist(),
+            )
+            # 3D array
+            us = self.generator.uniform(0, 1, size=(35, 3, 2))
+            self.assertEqual(
+                dist.cdf(a - 6*o + us * 12*o).tolist(),
+                utils.normal_cdf(a - 6*o + us * 12*o).tolist(),
+            )
 
         # Test when a != b and o = 0.
 
@@ -1797,25 +1732,24 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                     n / 5.,
                 )
             # broadcasting
-            for _ in range(7):
-                # 1D array
-                us = self.generator.uniform(0, 1, size=5)
-                self.assertEqual(
-                    dist.cdf(a + us * (b - a)).tolist(),
-                    us.tolist(),
-                )
-                # 2D array
-                us = self.generator.uniform(0, 1, size=(5, 3))
-                self.assertEqual(
-                    dist.cdf(a + us * (b - a)).tolist(),
-                    us.tolist(),
-                )
-                # 3D array
-                us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                self.assertEqual(
-                    dist.cdf(a + us * (b - a)).tolist(),
-                    us.tolist(),
-                )
+            # 1D array
+            us = self.generator.uniform(0, 1, size=35)
+            self.assertEqual(
+                dist.cdf(a + us * (b - a)).tolist(),
+                us.tolist(),
+            )
+            # 2D array
+            us = self.generator.uniform(0, 1, size=(35, 3))
+            self.assertEqual(
+                dist.cdf(a + us * (b - a)).tolist(),
+                us.tolist(),
+            )
+            # 3D array
+            us = self.generator.uniform(0, 1, size=(35, 3, 2))
+            self.assertEqual(
+                dist.cdf(a + us * (b - a)).tolist(),
+                us.tolist(),
+            )
 
         # Test outside of the distribution's support.
         for a, b, c, o in [(0., 1., 1, 0.), (0., 1., 2, 0.)]:
@@ -1858,43 +1792,42 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                             ) <= 1.,
                         ))
                     # broadcasting
-                    for _ in range(7):
-                        # 1D array
-                        us = self.generator.uniform(0, 1, size=5)
-                        self.assertEqual(
-                            dist.cdf(a - 6*o + us * 12*o).shape,
-                            us.shape,
-                        )
-                        self.assertTrue(np.all(
-                            dist.cdf(a - 6*o + us * 12*o) >= 0.,
-                        ))
-                        self.assertTrue(np.all(
-                            dist.cdf(a - 6*o + us * 12*o) <= 1.,
-                        ))
-                        # 2D array
-                        us = self.generator.uniform(0, 1, size=(5, 3))
-                        self.assertEqual(
-                            dist.cdf(a - 6*o + us * 12*o).shape,
-                            us.shape,
-                        )
-                        self.assertTrue(np.all(
-                            dist.cdf(a - 6*o + us * 12*o) >= 0.,
-                        ))
-                        self.assertTrue(np.all(
-                            dist.cdf(a - 6*o + us * 12*o) <= 1.,
-                        ))
-                        # 3D array
-                        us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                        self.assertEqual(
-                            dist.cdf(a - 6*o + us * 12*o).shape,
-                            us.shape,
-                        )
-                        self.assertTrue(np.all(
-                            dist.cdf(a - 6*o + us * 12*o) >= 0.,
-                        ))
-                        self.assertTrue(np.all(
-                            dist.cdf(a - 6*o + us * 12*o) <= 1.,
-                        ))
+                    # 1D array
+                    us = self.generator.uniform(0, 1, size=35)
+                    self.assertEqual(
+                        dist.cdf(a - 6*o + us * 12*o).shape,
+                        us.shape,
+                    )
+                    self.assertTrue(np.all(
+                        dist.cdf(a - 6*o + us * 12*o) >= 0.,
+                    ))
+                    self.assertTrue(np.all(
+                        dist.cdf(a - 6*o + us * 12*o) <= 1.,
+                    ))
+                    # 2D array
+                    us = self.generator.uniform(0, 1, size=(35, 3))
+                    self.assertEqual(
+                        dist.cdf(a - 6*o + us * 12*o).shape,
+                        us.shape,
+                    )
+                    self.assertTrue(np.all(
+                        dist.cdf(a - 6*o + us * 12*o) >= 0.,
+                    ))
+                    self.assertTrue(np.all(
+                        dist.cdf(a - 6*o + us * 12*o) <= 1.,
+                    ))
+                    # 3D array
+                    us = self.generator.uniform(0, 1, size=(35, 3, 2))
+                    self.assertEqual(
+                        dist.cdf(a - 6*o + us * 12*o).shape,
+                        us.shape,
+                    )
+                    self.assertTrue(np.all(
+                        dist.cdf(a - 6*o + us * 12*o) >= 0.,
+                    ))
+                    self.assertTrue(np.all(
+                        dist.cdf(a - 6*o + us * 12*o) <= 1.,
+                    ))
 
     @pytest.mark.level(3)
     def test_ppf(self):
@@ -1911,16 +1844,15 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                 self.assertTrue(np.isscalar(dist.ppf(n / 5.)))
                 self.assertEqual(dist.ppf(n / 5.), a)
             # broadcasting
-            for _ in range(7):
-                # 1D array
-                us = self.generator.uniform(0, 1, size=5)
-                self.assertEqual(dist.ppf(us).tolist(), [a] * 5)
-                # 2D array
-                us = self.generator.uniform(0, 1, size=(5, 3))
-                self.assertEqual(dist.ppf(us).tolist(), [[a] * 3] * 5)
-                # 3D array
-                us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                self.assertEqual(dist.ppf(us).tolist(), [[[a] * 2] * 3] * 5)
+            # 1D array
+            us = self.generator.uniform(0, 1, size=35)
+            self.assertEqual(dist.ppf(us).tolist(), [a] * 35)
+            # 2D array
+            us = self.generator.uniform(0, 1, size=(35, 3))
+            self.assertEqual(dist.ppf(us).tolist(), [[a] * 3] * 35)
+            # 3D array
+            us = self.generator.uniform(0, 1, size=(35, 3, 2))
+            self.assertEqual(dist.ppf(us).tolist(), [[[a] * 2] * 3] * 35)
 
         # Test when a = b and o > 0.
 
@@ -1939,25 +1871,24 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                     normal.ppf(n / 5.),
                 ))
             # broadcasting
-            for _ in range(7):
-                # 1D array
-                us = self.generator.uniform(0, 1, size=5)
-                self.assertTrue(np.allclose(
-                    dist.ppf(us).tolist(),
-                    normal.ppf(us).tolist(),
-                ))
-                # 2D array
-                us = self.generator.uniform(0, 1, size=(5, 3))
-                self.assertTrue(np.allclose(
-                    dist.ppf(us).tolist(),
-                    normal.ppf(us).tolist(),
-                ))
-                # 3D array
-                us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                self.assertTrue(np.allclose(
-                    dist.ppf(us).tolist(),
-                    normal.ppf(us).tolist(),
-                ))
+            # 1D array
+            us = self.generator.uniform(0, 1, size=35)
+            self.assertTrue(np.allclose(
+                dist.ppf(us).tolist(),
+                normal.ppf(us).tolist(),
+            ))
+            # 2D array
+            us = self.generator.uniform(0, 1, size=(35, 3))
+            self.assertTrue(np.allclose(
+                dist.ppf(us).tolist(),
+                normal.ppf(us).tolist(),
+            ))
+            # 3D array
+            us = self.generator.uniform(0, 1, size=(35, 3, 2))
+            self.assertTrue(np.allclose(
+                dist.ppf(us).tolist(),
+                normal.ppf(us).tolist(),
+            ))
 
         # Test when a != b and o = 0.
 
@@ -1975,25 +1906,24 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                     a + (n / 5.) * (b - a),
                 )
             # broadcasting
-            for _ in range(7):
-                # 1D array
-                us = self.generator.uniform(0, 1, size=5)
-                self.assertTrue(np.allclose(
-                    dist.ppf(us).tolist(),
-                    (a + us * (b - a)).tolist(),
-                ))
-                # 2D array
-                us = self.generator.uniform(0, 1, size=(5, 3))
-                self.assertTrue(np.allclose(
-                    dist.ppf(us).tolist(),
-                    (a + us * (b - a)).tolist(),
-                ))
-                # 3D array
-                us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                self.assertTrue(np.allclose(
-                    dist.ppf(us).tolist(),
-                    (a + us * (b - a)).tolist(),
-                ))
+            # 1D array
+            us = self.generator.uniform(0, 1, size=35)
+            self.assertTrue(np.allclose(
+                dist.ppf(us).tolist(),
+                (a + us * (b - a)).tolist(),
+            ))
+            # 2D array
+            us = self.generator.uniform(0, 1, size=(35, 3))
+            self.assertTrue(np.allclose(
+                dist.ppf(us).tolist(),
+                (a + us * (b - a)).tolist(),
+            ))
+            # 3D array
+            us = self.generator.uniform(0, 1, size=(35, 3, 2))
+            self.assertTrue(np.allclose(
+                dist.ppf(us).tolist(),
+                (a + us * (b - a)).tolist(),
+            ))
 
         # Test when a != b and o > 0.
 
@@ -2011,19 +1941,18 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                             dist.ppf(n / 5.),
                         )))
                     # broadcasting
-                    for _ in range(7):
-                        # 1D array
-                        us = self.generator.uniform(0, 1, size=5)
-                        self.assertEqual(dist.ppf(us).shape, us.shape)
-                        self.assertTrue(np.all(~np.isnan(dist.ppf(us))))
-                        # 2D array
-                        us = self.generator.uniform(0, 1, size=(5, 3))
-                        self.assertEqual(dist.ppf(us).shape, us.shape)
-                        self.assertTrue(np.all(~np.isnan(dist.ppf(us))))
-                        # 3D array
-                        us = self.generator.uniform(0, 1, size=(5, 3, 2))
-                        self.assertEqual(dist.ppf(us).shape, us.shape)
-                        self.assertTrue(np.all(~np.isnan(dist.ppf(us))))
+                    # 1D array
+                    us = self.generator.uniform(0, 1, size=35)
+                    self.assertEqual(dist.ppf(us).shape, us.shape)
+                    self.assertTrue(np.all(~np.isnan(dist.ppf(us))))
+                    # 2D array
+                    us = self.generator.uniform(0, 1, size=(35, 3))
+                    self.assertEqual(dist.ppf(us).shape, us.shape)
+                    self.assertTrue(np.all(~np.isnan(dist.ppf(us))))
+                    # 3D array
+                    us = self.generator.uniform(0, 1, size=(35, 3, 2))
+                    self.assertEqual(dist.ppf(us).shape, us.shape)
+                    self.assertTrue(np.all(~np.isnan(dist.ppf(us))))
 
     @pytest.mark.level(3)
     def test_quantile_tuning_curve(self):
@@ -2031,6 +1960,14 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
         for c in [1, 10]:
             for o in [1e-6, 1e-3, 1e0, 1e3]:
                 for convex in [False, True]:
+                    dist = parametric.NoisyQuadraticDistribution(
+                        a,
+                        b,
+                        c,
+                        o,
+                        convex=convex,
+                    )
+                    yss = dist.sample((2_000, 5))
                     for minimize in [None, False, True]:
                         # NOTE: When minimize is None, default to convex.
                         expect_minimize = (
@@ -2038,15 +1975,6 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                             if minimize is not None else
                             convex
                         )
-
-                        dist = parametric.NoisyQuadraticDistribution(
-                            a,
-                            b,
-                            c,
-                            o,
-                            convex=convex,
-                        )
-                        yss = dist.sample((2_000, 5))
                         curve_lo, curve, curve_hi = np.sort(
                             np.minimum.accumulate(yss, axis=1)
                             if expect_minimize else
@@ -2199,54 +2127,20 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                         ))
 
                         # Test ns <= 0.
-                        with self.assertRaises(ValueError):
-                            dist.quantile_tuning_curve(
-                                0,
-                                q=0.5,
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.quantile_tuning_curve(
-                                -1,
-                                q=0.5,
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.quantile_tuning_curve(
-                                [0],
-                                q=0.5,
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.quantile_tuning_curve(
-                                [-2],
-                                q=0.5,
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.quantile_tuning_curve(
-                                [0, 1],
-                                q=0.5,
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.quantile_tuning_curve(
-                                [-2, 1],
-                                q=0.5,
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.quantile_tuning_curve(
-                                [[0], [1]],
-                                q=0.5,
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.quantile_tuning_curve(
-                                [[-2], [1]],
-                                q=0.5,
-                                minimize=minimize,
-                            )
+                        for ns in [
+                                # scalar
+                                0, -1,
+                                # 1D array
+                                [0], [-2], [0, 1], [-2, 1],
+                                # 2D array
+                                [[0], [1]], [[-2], [1]],
+                        ]:
+                            with self.assertRaises(ValueError):
+                                dist.quantile_tuning_curve(
+                                    ns,
+                                    q=0.5,
+                                    minimize=minimize,
+                                )
 
     @pytest.mark.level(3)
     def test_average_tuning_curve(self):
@@ -2259,6 +2153,14 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
         for c in [2]:
             for o in [1e-3]:
                 for convex in [False, True]:
+                    dist = parametric.NoisyQuadraticDistribution(
+                        a,
+                        b,
+                        c,
+                        o,
+                        convex=convex,
+                    )
+                    yss = dist.sample((2_000, 5))
                     for minimize in [None, False, True]:
                         # NOTE: When minimize is None, default to convex.
                         expect_minimize = (
@@ -2266,15 +2168,6 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                             if minimize is not None else
                             convex
                         )
-
-                        dist = parametric.NoisyQuadraticDistribution(
-                            a,
-                            b,
-                            c,
-                            o,
-                            convex=convex,
-                        )
-                        yss = dist.sample((2_000, 5))
                         curves = (
                             np.minimum.accumulate(yss, axis=1)
                             if expect_minimize else
@@ -2401,46 +2294,19 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
                         ))
 
                         # Test ns <= 0.
-                        with self.assertRaises(ValueError):
-                            dist.average_tuning_curve(
-                                0,
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.average_tuning_curve(
-                                -1,
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.average_tuning_curve(
-                                [0],
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.average_tuning_curve(
-                                [-2],
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.average_tuning_curve(
-                                [0, 1],
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.average_tuning_curve(
-                                [-2, 1],
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.average_tuning_curve(
-                                [[0], [1]],
-                                minimize=minimize,
-                            )
-                        with self.assertRaises(ValueError):
-                            dist.average_tuning_curve(
-                                [[-2], [1]],
-                                minimize=minimize,
-                            )
+                        for ns in [
+                                # scalar
+                                0, -1,
+                                # 1D array
+                                [0], [-2], [0, 1], [-2, 1],
+                                # 2D array
+                                [[0], [1]], [[-2], [1]],
+                        ]:
+                            with self.assertRaises(ValueError):
+                                dist.average_tuning_curve(
+                                    ns,
+                                    minimize=minimize,
+                                )
 
     def test_sample_defaults_to_global_random_number_generator(self):
         # sample should be deterministic if global seed is set.
@@ -2842,11 +2708,11 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
 
     @pytest.mark.level(3)
     def test_quantile_tuning_curve_minimize_is_dual_to_maximize(self):
+        ns = np.arange(1, 17)
+
         for a, b, c in [(0., 1., 1), (-1., 10., 2)]:
             for o in [1e-6, 1e-3, 1e0, 1e3]:
                 for convex in [False, True]:
-                    ns = np.arange(1, 17)
-
                     self.assertTrue(np.allclose(
                         parametric
                           .NoisyQuadraticDistribution(
@@ -2872,11 +2738,11 @@ class NoisyQuadraticDistributionTestCase(testcases.RandomTestCase):
 
     @pytest.mark.level(3)
     def test_average_tuning_curve_minimize_is_dual_to_maximize(self):
+        ns = np.arange(1, 17)
+
         for a, b, c in [(0., 1., 1), (-1., 10., 2)]:
             for o in [1e-6, 1e-3, 1e0, 1e3]:
                 for convex in [False, True]:
-                    ns = np.arange(1, 17)
-
                     self.assertTrue(np.allclose(
                         parametric
                           .NoisyQuadraticDistribution(
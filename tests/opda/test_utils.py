@@ -4,103 +4,78 @@ import unittest
 
 import numpy as np
 import pytest
-from scipy import stats
+from scipy import special, stats
 
 from opda import utils
 
 from tests import testcases
 
 
+def _beta_parameters(values, *, ndim, highest_density=False):
+    """Return a and b for every pair of parameters from ``values``.
+
+    The pairs run along the first axis of the returned arrays, which
+    have ``ndim`` dimensions so they broadcast against the other inputs.
+    If ``highest_density`` is true, skip the pairs where a <= 1 and
+    b <= 1, since no highest density interval exists for them.
+    """
+    ab = np.array([
+        (a, b)
+        for a in values
+        for b in values
+        if not highest_density or a > 1. or b > 1.
+    ])
+    shape = (len(ab),) + (1,) * (ndim - 1)
+    return ab[:, 0].reshape(shape), ab[:, 1].reshape(shape)
+
+
 class SortByFirstTestCase(unittest.TestCase):
     """Test opda.utils.sort_by_first."""
 
     def test_sort_by_first(self):
-        def tolist(a):
-            return a.tolist()
-
         # Test on no arguments.
         self.assertEqual(utils.sort_by_first(), ())
-        # Test on empty lists.
-        self.assertEqual(
-            tuple(map(tolist, utils.sort_by_first([]))),
-            ([],),
-        )
-        self.assertEqual(
-            tuple(map(tolist, utils.sort_by_first([], []))),
-            ([], []),
-        )
-        self.assertEqual(
-            tuple(map(tolist, utils.sort_by_first([], [], []))),
-            ([], [], []),
-        )
-        # Test list of length 1.
-        self.assertEqual(
-            tuple(map(tolist, utils.sort_by_first([1.]))),
-            ([1.],),
-        )
-        self.assertEqual(
-            tuple(map(tolist, utils.sort_by_first([1.], [2.]))),
-            ([1.], [2.]),
-        )
-        self.assertEqual(
-            tuple(map(tolist, utils.sort_by_first([1.], [2.], ["a"]))),
-            ([1.], [2.], ["a"]),
-        )
-        # Test lists of length greater than 1.
-        #   when first is sorted
-        self.assertEqual(
-            tuple(map(tolist, utils.sort_by_first([1., 2., 3.]))),
-            ([1., 2., 3.],),
-        )
-        self.assertEqual(
-            tuple(map(tolist, utils.sort_by_first(
-                [1., 2., 3.],
-                [3., 2., 1.],
-            ))),
-            (
-                [1., 2., 3.],
-                [3., 2., 1.],
-            ),
-        )
-        self.assertEqual(
-            tuple(map(tolist, utils.sort_by_first(
-                [1., 2., 3.],
-                [3., 2., 1.],
-                ["a", "c", "b"],
-            ))),
-            (
-                [1., 2., 3.],
-                [3., 2., 1.],
-                ["a", "c", "b"],
-            ),
-        )
-        #   when first is unsorted
-        self.assertEqual(
-            tuple(map(tolist, utils.sort_by_first([2., 1., 3.]))),
-            ([1., 2., 3.],),
-        )
-        self.assertEqual(
-            tuple(map(tolist, utils.sort_by_first(
-                [2., 1., 3.],
-                [3., 2., 1.],
-            ))),
-            (
-                [1., 2., 3.],
-                [2., 3., 1.],
-            ),
-        )
-        self.assertEqual(
-            tuple(map(tolist, utils.sort_by_first(
-                [2., 1., 3.],
-                [3., 2., 1.],
-                ["a", "c", "b"],
-            ))),
-            (
-                [1., 2., 3.],
-                [2., 3., 1.],
-                ["c", "a", "b"],
-            ),
-        )
+        # Test on one or more arguments.
+        for args, expected in [
+                # empty lists
+                (([],), ([],)),
+                (([], []), ([], [])),
+                (([], [], []), ([], [], [])),
+                # lists of length 1
+                (([1.],), ([1.],)),
+                (([1.], [2.]), ([1.], [2.])),
+                (([1.], [2.], ["a"]), ([1.], [2.], ["a"])),
+                # lists of length greater than 1 when first is sorted
+                (
+                    ([1., 2., 3.],),
+                    ([1., 2., 3.],),
+                ),
+                (
+                    ([1., 2., 3.], [3., 2., 1.]),
+                    ([1., 2., 3.], [3., 2., 1.]),
+                ),
+                (
+                    ([1., 2., 3.], [3., 2., 1.], ["a", "c", "b"]),
+                    ([1., 2., 3.], [3., 2., 1.], ["a", "c", "b"]),
+                ),
+                # lists of length greater than 1 when first is unsorted
+                (
+                    ([2., 1., 3.],),
+                    ([1., 2., 3.],),
+                ),
+                (
+                    ([2., 1., 3.], [3., 2., 1.]),
+                    ([1., 2., 3.], [2., 3., 1.]),
+                ),
+                (
+                    ([2., 1., 3.], [3., 2., 1.], ["a", "c", "b"]),
+                    ([1., 2., 3.], [2., 3., 1.], ["c", "a", "b"]),
+                ),
+        ]:
+            self.assertEqual(
+                tuple(arr.tolist() for arr in utils.sort_by_first(*args)),
+                expected,
+            )
 
 
 class DkwEpsilonTestCase(unittest.TestCase):
@@ -125,6 +100,9 @@ class DkwEpsilonTestCase(unittest.TestCase):
         self.assertAlmostEqual(utils.dkw_epsilon(1, 1. - 2./np.e**2), 1.)
         self.assertAlmostEqual(utils.dkw_epsilon(4, 1. - 2./np.e**2), 0.5)
 
+        # Test the return type.
+        self.assertIsInstance(utils.dkw_epsilon(4, 0.5), np.float64)
+
         # Test error conditions.
         #   when n is not a scalar
         with self.assertRaises(ValueError):
@@ -151,324 +129,454 @@ class DkwEpsilonTestCase(unittest.TestCase):
 class BetaEqualTailedIntervalTestCase(testcases.RandomTestCase):
     """Test opda.utils.beta_equal_tailed_interval."""
 
-    def test_beta_equal_tailed_interval(self):
-        # Test when a and b are scalars.
-        for a in [1., 5., 10.]:
-            for b in [1., 5., 10.]:
-                beta = stats.beta(a, b)
-                # when coverage is a scalar.
-                for coverage in [0.25, 0.50, 0.75]:
-                    lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
-                    self.assertEqual(lo.shape, ())
-                    self.assertEqual(hi.shape, ())
-                    self.assertAlmostEqual(
-                        beta.cdf(hi) - beta.cdf(lo),
-                        coverage,
-                    )
-                    self.assertLess(lo, beta.ppf(0.5))
-                    self.assertGreater(hi, beta.ppf(0.5))
-                    self.assertAlmostEqual(beta.cdf(lo), (1. - coverage) / 2.)
-                    self.assertAlmostEqual(beta.cdf(hi), (1. + coverage) / 2.)
-                # when coverage is an array.
-                k = 5
-                coverage = self.generator.random(size=k)
-                lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
-                self.assertEqual(lo.shape, (k,))
-                self.assertEqual(hi.shape, (k,))
-                self.assertTrue(np.allclose(
-                    beta.cdf(hi) - beta.cdf(lo),
-                    coverage,
-                ))
-                self.assertTrue(np.all(
-                    (lo < beta.ppf(0.5)) & (hi > beta.ppf(0.5)),
-                ))
-                self.assertTrue(np.all(
-                    np.abs(beta.cdf(lo) - (1. - coverage) / 2.)
-                    < 1e-10,
-                ))
-                self.assertTrue(np.all(
-                    np.abs(beta.cdf(hi) - (1. + coverage) / 2.)
-                    < 1e-10,
-                ))
-        # Test when a and b are 1D arrays.
+    def test_beta_equal_tailed_interval_when_a_and_b_are_scalars(self):
+        a = np.array([1., 5., 10.])[:, None, None]
+        b = np.array([1., 5., 10.])[None, :, None]
+        median = special.betaincinv(a, b, 0.5)
+        # Test when coverage is a scalar.
+        coverage = np.array([0.25, 0.50, 0.75])[None, None, :]
+        lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+        cdf_lo, cdf_hi = special.betainc(a, b, np.stack([lo, hi]))
+        self.assertEqual(lo.shape, (3, 3, 3))
+        self.assertEqual(hi.shape, (3, 3, 3))
+        self.assertTrue(np.allclose(
+            cdf_hi - cdf_lo,
+            coverage,
+        ))
+        self.assertTrue(np.all(
+            (lo < median) & (hi > median),
+        ))
+        self.assertTrue(np.allclose(cdf_lo, (1. - coverage) / 2.))
+        self.assertTrue(np.allclose(cdf_hi, (1. + coverage) / 2.))
+        for i, j, m in np.ndindex(3, 3, 3):
+            lo_ijl, hi_ijl = utils.beta_equal_tailed_interval(
+                a[i, 0, 0], b[0, j, 0], coverage[0, 0, m],
+            )
+            self.assertEqual(lo_ijl.shape, ())
+            self.assertEqual(hi_ijl.shape, ())
+            self.assertAlmostEqual(lo_ijl, lo[i, j, m])
+            self.assertAlmostEqual(hi_ijl, hi[i, j, m])
+        # Test when coverage is an array.
+        k = 5
+        coverage = self.generator.random(size=(3, 3, k))
+        lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+        cdf_lo, cdf_hi = special.betainc(a, b, np.stack([lo, hi]))
+        self.assertEqual(lo.shape, (3, 3, k))
+        self.assertEqual(hi.shape, (3, 3, k))
+        self.assertTrue(np.allclose(
+            cdf_hi - cdf_lo,
+            coverage,
+        ))
+        self.assertTrue(np.all(
+            (lo < median) & (hi > median),
+        ))
+        self.assertTrue(np.allclose(
+            cdf_lo,
+            (1. - coverage) / 2.,
+            rtol=0.,
+            atol=1e-10,
+        ))
+        self.assertTrue(np.allclose(
+            cdf_hi,
+            (1. + coverage) / 2.,
+            rtol=0.,
+            atol=1e-10,
+        ))
+        for i, j in np.ndindex(3, 3):
+            lo_ij, hi_ij = utils.beta_equal_tailed_interval(
+                a[i, 0, 0], b[0, j, 0], coverage[i, j],
+            )
+            self.assertEqual(lo_ij.shape, (k,))
+            self.assertEqual(hi_ij.shape, (k,))
+            self.assertTrue(np.allclose(lo_ij, lo[i, j]))
+            self.assertTrue(np.allclose(hi_ij, hi[i, j]))
+
+    def test_beta_equal_tailed_interval_when_a_and_b_are_1d_arrays(self):
         n = 10
         a = np.arange(1, n + 1)
         b = np.arange(n + 1, 1, -1)
-        beta = stats.beta(a, b)
-        #   when coverage is a scalar.
+        median = special.betaincinv(a, b, 0.5)
+        # Test when coverage is a scalar.
         for coverage in [0.25, 0.50, 0.75]:
             lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+            cdf_lo, cdf_hi = special.betainc(a, b, np.stack([lo, hi]))
             self.assertEqual(lo.shape, (n,))
             self.assertEqual(hi.shape, (n,))
-            self.assertTrue(np.all(
-                np.abs((beta.cdf(hi) - beta.cdf(lo)) - coverage)
-                < 1e-10,
+            self.assertTrue(np.allclose(
+                cdf_hi - cdf_lo,
+                coverage,
+                rtol=0.,
+                atol=1e-10,
             ))
             self.assertTrue(np.all(
-                (lo < beta.ppf(0.5)) & (hi > beta.ppf(0.5)),
+                (lo < median) & (hi > median),
             ))
-            self.assertTrue(np.all(
-                np.abs(beta.cdf(lo) - (1. - coverage) / 2.)
-                < 1e-10,
+            self.assertTrue(np.allclose(
+                cdf_lo,
+                (1. - coverage) / 2.,
+                rtol=0.,
+                atol=1e-10,
             ))
-            self.assertTrue(np.all(
-                np.abs(beta.cdf(hi) - (1. + coverage) / 2.)
-                < 1e-10,
+            self.assertTrue(np.allclose(
+                cdf_hi,
+                (1. + coverage) / 2.,
+                rtol=0.,
+                atol=1e-10,
             ))
-        #   when coverage is an array.
+        # Test when coverage is an array.
         coverage = self.generator.random(size=n)
         lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+        cdf_lo, cdf_hi = special.betainc(a, b, np.stack([lo, hi]))
         self.assertEqual(lo.shape, (n,))
         self.assertEqual(hi.shape, (n,))
         self.assertTrue(np.allclose(
-            beta.cdf(hi) - beta.cdf(lo),
+            cdf_hi - cdf_lo,
             coverage,
         ))
         self.assertTrue(np.all(
-            (lo < beta.ppf(0.5)) & (hi > beta.ppf(0.5)),
+            (lo < median) & (hi > median),
         ))
-        self.assertTrue(np.all(
-            np.abs(beta.cdf(lo) - (1. - coverage) / 2.)
-            < 1e-10,
+        self.assertTrue(np.allclose(
+            cdf_lo,
+            (1. - coverage) / 2.,
+            rtol=0.,
+            atol=1e-10,
         ))
-        self.assertTrue(np.all(
-            np.abs(beta.cdf(hi) - (1. + coverage) / 2.)
-            < 1e-10,
+        self.assertTrue(np.allclose(
+            cdf_hi,
+            (1. + coverage) / 2.,
+            rtol=0.,
+            atol=1e-10,
         ))
-        # Test when a and b are 2D arrays.
+
+    def test_beta_equal_tailed_interval_when_a_and_b_are_2d_arrays(self):
         n, m = 5, 2
         a = np.arange(1, n * m + 1).reshape(n, m)
         b = np.arange(n * m + 1, 1, -1).reshape(n, m)
-        beta = stats.beta(a, b)
-        #   when coverage is a scalar.
+        median = special.betaincinv(a, b, 0.5)
+        # Test when coverage is a scalar.
         for coverage in [0.25, 0.50, 0.75]:
             lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+            cdf_lo, cdf_hi = special.betainc(a, b, np.stack([lo, hi]))
             self.assertEqual(lo.shape, (n, m))
             self.assertEqual(hi.shape, (n, m))
-            self.assertTrue(np.all(
-                np.abs((beta.cdf(hi) - beta.cdf(lo)) - coverage)
-                < 1e-10,
+            self.assertTrue(np.allclose(
+                cdf_hi - cdf_lo,
+                coverage,
+                rtol=0.,
+                atol=1e-10,
             ))
             self.assertTrue(np.all(
-                (lo < beta.ppf(0.5)) & (hi > beta.ppf(0.5)),
+                (lo < median) & (hi > median),
             ))
-            self.assertTrue(np.all(
-                np.abs(beta.cdf(lo) - (1. - coverage) / 2.)
-                < 1e-10,
+            self.assertTrue(np.allclose(
+                cdf_lo,
+                (1. - coverage) / 2.,
+                rtol=0.,
+                atol=1e-10,
             ))
-            self.assertTrue(np.all(
-                np.abs(beta.cdf(hi) - (1. + coverage) / 2.)
-                < 1e-10,
+            self.assertTrue(np.allclose(
+                cdf_hi,
+                (1. + coverage) / 2.,
+                rtol=0.,
+                atol=1e-10,
             ))
-        #   when coverage is an array.
+        # Test when coverage is an array.
         coverage = self.generator.random(size=(n, m))
         lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+        cdf_lo, cdf_hi = special.betainc(a, b, np.stack([lo, hi]))
         self.assertEqual(lo.shape, (n, m))
         self.assertEqual(hi.shape, (n, m))
         self.assertTrue(np.allclose(
-            beta.cdf(hi) - beta.cdf(lo),
+            cdf_hi - cdf_lo,
             coverage,
         ))
         self.assertTrue(np.all(
-            (lo < beta.ppf(0.5)) & (hi > beta.ppf(0.5)),
+            (lo < median) & (hi > median),
         ))
-        self.assertTrue(np.all(
-            np.abs(beta.cdf(lo) - (1. - coverage) / 2.)
-            < 1e-10,
+        self.assertTrue(np.allclose(
+            cdf_lo,
+            (1. - coverage) / 2.,
+            rtol=0.,
+            atol=1e-10,
         ))
-        self.assertTrue(np.all(
-            np.abs(beta.cdf(hi) - (1. + coverage) / 2.)
-            < 1e-10,
+        self.assertTrue(np.allclose(
+            cdf_hi,
+            (1. + coverage) / 2.,
+            rtol=0.,
+            atol=1e-10,
         ))
-        # Test when a and b broadcast over each other.
+
+    def test_beta_equal_tailed_interval_when_a_and_b_broadcast(self):
         n, m = 5, 2
         a = np.arange(1, n + 1).reshape(n, 1)
         b = np.arange(m + 1, 1, -1).reshape(1, m)
-        beta = stats.beta(a, b)
-        #   when coverage is a scalar.
+        median = special.betaincinv(a, b, 0.5)
+        # Test when coverage is a scalar.
         for coverage in [0.25, 0.50, 0.75]:
             lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+            cdf_lo, cdf_hi = special.betainc(a, b, np.stack([lo, hi]))
             self.assertEqual(lo.shape, (n, m))
             self.assertEqual(hi.shape, (n, m))
-            self.assertTrue(np.all(
-                np.abs((beta.cdf(hi) - beta.cdf(lo)) - coverage)
-                < 1e-10,
+            self.assertTrue(np.allclose(
+                cdf_hi - cdf_lo,
+                coverage,
+                rtol=0.,
+                atol=1e-10,
             ))
             self.assertTrue(np.all(
-                (lo < beta.ppf(0.5)) & (hi > beta.ppf(0.5)),
+                (lo < median) & (hi > median),
             ))
-            self.assertTrue(np.all(
-                np.abs(beta.cdf(lo) - (1. - coverage) / 2.)
-                < 1e-10,
+            self.assertTrue(np.allclose(
+                cdf_lo,
+                (1. - coverage) / 2.,
+                rtol=0.,
+                atol=1e-10,
             ))
-            self.assertTrue(np.all(
-                np.abs(beta.cdf(hi) - (1. + coverage) / 2.)
-                < 1e-10,
+            self.assertTrue(np.allclose(
+                cdf_hi,
+                (1. + coverage) / 2.,
+                rtol=0.,
+                atol=1e-10,
             ))
-        #   when coverage is an array.
+        # Test when coverage is an array.
         coverage = self.generator.random(size=(n, m))
         lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+        cdf_lo, cdf_hi = special.betainc(a, b, np.stack([lo, hi]))
         self.assertEqual(lo.shape, (n, m))
         self.assertEqual(hi.shape, (n, m))
         self.assertTrue(np.allclose(
-            beta.cdf(hi) - beta.cdf(lo),
+            cdf_hi - cdf_lo,
             coverage,
         ))
         self.assertTrue(np.all(
-            (lo < beta.ppf(0.5)) & (hi > beta.ppf(0.5)),
+            (lo < median) & (hi > median),
         ))
-        self.assertTrue(np.all(
-            np.abs(beta.cdf(lo) - (1. - coverage) / 2.)
-            < 1e-10,
+        self.assertTrue(np.allclose(
+            cdf_lo,
+            (1. - coverage) / 2.,
+            rtol=0.,
+            atol=1e-10,
         ))
-        self.assertTrue(np.all(
-            np.abs(beta.cdf(hi) - (1. + coverage) / 2.)
-            < 1e-10,
+        self.assertTrue(np.allclose(
+            cdf_hi,
+            (1. + coverage) / 2.,
+            rtol=0.,
+            atol=1e-10,
         ))
-        # Test when coverage broadcasts over a and b.
-        #   when a and b have the same shape.
+
+    def test_beta_equal_tailed_interval_when_coverage_broadcasts(self):
+        # Test when a and b have the same shape.
         n = 10
         a = np.arange(1, n + 1)[:, None]
         b = np.arange(n + 1, 1, -1)[:, None]
-        beta = stats.beta(a, b)
+        median = special.betaincinv(a, b, 0.5)
         k = 5
         coverage = self.generator.random(size=k)[None, :]
         lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+        cdf_lo, cdf_hi = special.betainc(a, b, np.stack([lo, hi]))
         self.assertEqual(lo.shape, (n, k))
         self.assertEqual(hi.shape, (n, k))
         self.assertTrue(np.allclose(
-            beta.cdf(hi) - beta.cdf(lo),
-            np.tile(coverage, (n, 1)),
+            cdf_hi - cdf_lo,
+            coverage,
         ))
         self.assertTrue(np.all(
-            (lo < beta.ppf(0.5)) & (hi > beta.ppf(0.5)),
+            (lo < median) & (hi > median),
         ))
-        self.assertTrue(np.all(
-            np.abs(beta.cdf(lo) - (1. - coverage) / 2.)
-            < 1e-10,
+        self.assertTrue(np.allclose(
+            cdf_lo,
+            (1. - coverage) / 2.,
+            rtol=0.,
+            atol=1e-10,
         ))
-        self.assertTrue(np.all(
-            np.abs(beta.cdf(hi) - (1. + coverage) / 2.)
-            < 1e-10,
+        self.assertTrue(np.allclose(
+            cdf_hi,
+            (1. + coverage) / 2.,
+            rtol=0.,
+            atol=1e-10,
         ))
-        #   when a and b broadcast over each other.
+        # Test when a and b broadcast over each other.
         n, m = 3, 2
         a = np.arange(1, n + 1).reshape(n, 1)[..., None]
         b = np.arange(m + 1, 1, -1).reshape(1, m)[..., None]
-        beta = stats.beta(a, b)
+        median = special.betaincinv(a, b, 0.5)
         k = 5
         coverage = self.generator.random(size=k)[None, None, :]
         lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+        cdf_lo, cdf_hi = special.betainc(a, b, np.stack([lo, hi]))
         self.assertEqual(lo.shape, (n, m, k))
         self.assertEqual(hi.shape, (n, m, k))
         self.assertTrue(np.allclose(
-            beta.cdf(hi) - beta.cdf(lo),
-            np.tile(coverage, (n, m, 1)),
+            cdf_hi - cdf_lo,
+            coverage,
         ))
         self.assertTrue(np.all(
-            (lo < beta.ppf(0.5)) & (hi > beta.ppf(0.5)),
+            (lo < median) & (hi > median),
         ))
-        self.assertTrue(np.all(
-            np.abs(beta.cdf(lo) - (1. - coverage) / 2.)
-            < 1e-10,
+        self.assertTrue(np.allclose(
+            cdf_lo,
+            (1. - coverage) / 2.,
+            rtol=0.,
+            atol=1e-10,
         ))
-        self.assertTrue(np.all(
-            np.abs(beta.cdf(hi) - (1. + coverage) / 2.)
-            < 1e-10,
+        self.assertTrue(np.allclose(
+            cdf_hi,
+            (1. + coverage) / 2.,
+            rtol=0.,
+            atol=1e-10,
         ))
 
     @pytest.mark.level(1)
     def test_on_small_confidences(self):
-        for coverage in [1e-8, 1e-12, 1e-16]:
-            for a in [1., 5., 10.]:
-                for b in [1., 5., 10.]:
-                    beta = stats.beta(a, b)
-                    lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
-                    self.assertEqual(lo.shape, ())
-                    self.assertEqual(hi.shape, ())
-                    self.assertLessEqual(lo, hi)
-                    self.assertAlmostEqual(
-                        beta.cdf(hi) - beta.cdf(lo),
-                        coverage,
-                    )
-                    self.assertLessEqual(lo, beta.ppf(0.5))
-                    self.assertGreaterEqual(hi, beta.ppf(0.5))
+        a = np.array([1., 5., 10.])[:, None, None]
+        b = np.array([1., 5., 10.])[None, :, None]
+        median = special.betaincinv(a, b, 0.5)
+        coverage = np.array([1e-8, 1e-12, 1e-16])[None, None, :]
+        lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+        cdf_lo, cdf_hi = special.betainc(a, b, np.stack([lo, hi]))
+        self.assertEqual(lo.shape, (3, 3, 3))
+        self.assertEqual(hi.shape, (3, 3, 3))
+        self.assertTrue(np.all(lo <= hi))
+        self.assertTrue(np.allclose(
+            cdf_hi - cdf_lo,
+            coverage,
+            rtol=0.,
+            atol=5e-8,
+        ))
+        self.assertTrue(np.all(
+            (lo <= median) & (hi >= median),
+        ))
 
     def test_on_zero_coverage(self):
         for a in [1., 5., 10.]:
             for b in [1., 5., 10.]:
-                beta = stats.beta(a, b)
                 lo, hi = utils.beta_equal_tailed_interval(a, b, 0.)
+                cdf_lo, cdf_hi = special.betainc(a, b, np.stack([lo, hi]))
                 self.assertEqual(lo.shape, ())
                 self.assertEqual(hi.shape, ())
                 self.assertLessEqual(lo, hi)
                 self.assertAlmostEqual(lo, hi)
-                self.assertAlmostEqual(beta.cdf(lo), 0.5)
-                self.assertAlmostEqual(beta.cdf(hi), 0.5)
-                self.assertAlmostEqual(beta.cdf(hi) - beta.cdf(lo), 0.)
+                self.assertAlmostEqual(cdf_lo, 0.5)
+                self.assertAlmostEqual(cdf_hi, 0.5)
+                self.assertAlmostEqual(cdf_hi - cdf_lo, 0.)
+
+    def test_on_large_coverages(self):
+        # NOTE: When a = 1, the beta distribution's PPF has a closed form,
+        # so compare against that.
+        b = np.array([1., 5., 10.])[:, None]
+        coverage = np.array([1. - 1e-5, 1. - 1e-10, 1. - 2**-52])[None, :]
+        tail = (1. - coverage) / 2.
+        lo, hi = utils.beta_equal_tailed_interval(1., b, coverage)
+        self.assertEqual(lo.shape, (3, 3))
+        self.assertEqual(hi.shape, (3, 3))
+        self.assertTrue(np.allclose(
+            lo,
+            1. - (1. - tail)**(1 / b),
+            rtol=0.,
+            atol=1e-12,
+        ))
+        self.assertTrue(np.allclose(
+            hi,
+            1. - tail**(1 / b),
+            rtol=0.,
+            atol=1e-12,
+        ))
+
+    def test_on_float32_inputs(self):
+        a = self.generator.uniform(0.5, 10., size=(3, 5))
+        b = self.generator.uniform(0.5, 10., size=(3, 5))
+        coverage = self.generator.uniform(0., 1., size=(3, 5))
+        lo_32, hi_32 = utils.beta_equal_tailed_interval(
+            a.astype(np.float32),
+            b.astype(np.float32),
+            coverage.astype(np.float32),
+        )
+        lo_64, hi_64 = utils.beta_equal_tailed_interval(
+            a.astype(np.float32).astype(np.float64),
+            b.astype(np.float32).astype(np.float64),
+            coverage.astype(np.float32).astype(np.float64),
+        )
+        self.assertEqual(lo_32.dtype, np.float64)
+        self.assertEqual(hi_32.dtype, np.float64)
+        self.assertTrue(np.array_equal(lo_32, lo_64))
+        self.assertTrue(np.array_equal(hi_32, hi_64))
 
 
 class BetaHighestDensityIntervalTestCase(testcases.RandomTestCase):
     """Test opda.utils.beta_highest_density_interval."""
 
-    def test_beta_highest_density_interval(self):
-        # Test when a and b are scalars.
-        for a in [1., 5., 10.]:
-            for b in [1., 5., 10.]:
-                if a == 1. and b == 1.:
-                    # No highest density interval exists when a <= 1 and b <= 1.
-                    continue
-                mode = (a - 1) / (a + b - 2)
-                beta = stats.beta(a, b)
-                # when coverage is a scalar.
-                for coverage in [0.25, 0.50, 0.75]:
-                    lo, hi = utils.beta_highest_density_interval(a, b, coverage)
-                    self.assertEqual(lo.shape, ())
-                    self.assertEqual(hi.shape, ())
-                    self.assertAlmostEqual(
-                        beta.cdf(hi) - beta.cdf(lo),
-                        coverage,
-                    )
-                    self.assertLessEqual(lo, mode)
-                    self.assertGreaterEqual(hi, mode)
-                    equal_tailed_lo, equal_tailed_hi =\
-                        utils.beta_equal_tailed_interval(a, b, coverage)
-                    self.assertLess(
-                        (hi - lo) - (equal_tailed_hi - equal_tailed_lo),
-                        1e-12,
-                    )
-                # when coverage is an array.
-                k = 5
-                coverage = self.generator.random(size=k)
-                lo, hi = utils.beta_highest_density_interval(a, b, coverage)
-                self.assertEqual(lo.shape, (k,))
-                self.assertEqual(hi.shape, (k,))
-                self.assertTrue(np.allclose(
-                    beta.cdf(hi) - beta.cdf(lo),
-                    coverage,
-                ))
-                self.assertTrue(np.all(
-                    (lo <= mode) & (hi >= mode),
-                ))
-                equal_tailed_lo, equal_tailed_hi =\
-                    utils.beta_equal_tailed_interval(a, b, coverage)
-                self.assertTrue(np.all(
-                    (hi - lo) - (equal_tailed_hi - equal_tailed_lo) < 1e-12,
-                ))
-        # Test when a and b are 1D arrays.
+    def test_beta_highest_density_interval_when_a_and_b_are_scalars(self):
+        a, b = _beta_parameters([1., 5., 10.], ndim=2, highest_density=True)
+        n_ab = len(a)
+        mode = (a - 1) / (a + b - 2)
+        # Test when coverage is a scalar.
+        coverage = np.array([0.25, 0.50, 0.75])[None, :]
+        lo, hi = utils.beta_highest_density_interval(a, b, coverage)
+        self.assertEqual(lo.shape, (n_ab, 3))
+        self.assertEqual(hi.shape, (n_ab, 3))
+        self.assertTrue(np.allclose(
+            special.betainc(a, b, hi) - special.betainc(a, b, lo),
+            coverage,
+        ))
+        self.assertTrue(np.all(
+            (lo <= mode) & (hi >= mode),
+        ))
+        equal_tailed_lo, equal_tailed_hi =\
+            utils.beta_equal_tailed_interval(a, b, coverage)
+        self.assertTrue(np.all(
+            (hi - lo) - (equal_tailed_hi - equal_tailed_lo) < 1e-12,
+        ))
+        for i, j in np.ndindex(n_ab, 3):
+            lo_ij, hi_ij = utils.beta_highest_density_interval(
+                a[i, 0], b[i, 0], coverage[0, j],
+            )
+            self.assertEqual(lo_ij.shape, ())
+            self.assertEqual(hi_ij.shape, ())
+            self.assertAlmostEqual(lo_ij, lo[i, j])
+            self.assertAlmostEqual(hi_ij, hi[i, j])
+        # Test when coverage is an array.
+        k = 5
+        coverage = self.generator.random(size=(n_ab, k))
+        lo, hi = utils.beta_highest_density_interval(a, b, coverage)
+        self.assertEqual(lo.shape, (n_ab, k))
+        self.assertEqual(hi.shape, (n_ab, k))
+        self.assertTrue(np.allclose(
+            special.betainc(a, b, hi) - special.betainc(a, b, lo),
+            coverage,
+        ))
+        self.assertTrue(np.all(
+            (lo <= mode) & (hi >= mode),
+        ))
+        equal_tailed_lo, equal_tailed_hi =\
+            utils.beta_equal_tailed_interval(a, b, coverage)
+        self.assertTrue(np.all(
+            (hi - lo) - (equal_tailed_hi - equal_tailed_lo) < 1e-12,
+        ))
+        for i in range(n_ab):
+            lo_i, hi_i = utils.beta_highest_density_interval(
+                a[i, 0], b[i, 0], coverage[i],
+            )
+            self.assertEqual(lo_i.shape, (k,))
+            self.assertEqual(hi_i.shape, (k,))
+            self.assertTrue(np.allclose(lo_i, lo[i]))
+            self.assertTrue(np.allclose(hi_i, hi[i]))
+
+    def test_beta_highest_density_interval_when_a_and_b_are_1d_arrays(self):
         n = 10
         a = np.arange(1, n + 1)
         b = np.arange(n + 1, 1, -1)
         mode = (a - 1) / (a + b - 2)
-        beta = stats.beta(a, b)
-        #   when coverage is a scalar.
+        # Test when coverage is a scalar.
         for coverage in [0.25, 0.50, 0.75]:
             lo, hi = utils.beta_highest_density_interval(a, b, coverage)
             self.assertEqual(lo.shape, (n,))
             self.assertEqual(hi.shape, (n,))
-            self.assertTrue(np.all(
-                np.abs((beta.cdf(hi) - beta.cdf(lo)) - coverage)
-                < 1e-10,
+            self.assertTrue(np.allclose(
+                special.betainc(a, b, hi) - special.betainc(a, b, lo),
+                coverage,
+                rtol=0.,
+                atol=1e-10,
             ))
             self.assertTrue(np.all(
                 (lo <= mode) & (hi >= mode),
@@ -481,13 +589,13 @@ class BetaHighestDensityIntervalTestCase(testcases.RandomTestCase):
             self.assertTrue(np.any(
                 (equal_tailed_hi - equal_tailed_lo) - (hi - lo) > 1e-5,
             ))
-        #   when coverage is an array.
+        # Test when coverage is an array.
         coverage = self.generator.random(size=n)
         lo, hi = utils.beta_highest_density_interval(a, b, coverage)
         self.assertEqual(lo.shape, (n,))
         self.assertEqual(hi.shape, (n,))
         self.assertTrue(np.allclose(
-            beta.cdf(hi) - beta.cdf(lo),
+            special.betainc(a, b, hi) - special.betainc(a, b, lo),
             coverage,
         ))
         self.assertTrue(np.all(
@@ -501,20 +609,22 @@ class BetaHighestDensityIntervalTestCase(testcases.RandomTestCase):
         self.assertTrue(np.any(
             (equal_tailed_hi - equal_tailed_lo) - (hi - lo) > 1e-5,
         ))
-        # Test when a and b are 2D arrays.
+
+    def test_beta_highest_density_interval_when_a_and_b_are_2d_arrays(self):
         n, m = 5, 2
         a = np.arange(1, n * m + 1).reshape(n, m)
         b = np.arange(n * m + 1, 1, -1).reshape(n, m)
         mode = (a - 1) / (a + b - 2)
-        beta = stats.beta(a, b)
-        #   when coverage is a scalar.
+        # Test when coverage is a scalar.
         for coverage in [0.25, 0.50, 0.75]:
             lo, hi = utils.beta_highest_density_interval(a, b, coverage)
             self.assertEqual(lo.shape, (n, m))
             self.assertEqual(hi.shape, (n, m))
-            self.assertTrue(np.all(
-                np.abs((beta.cdf(hi) - beta.cdf(lo)) - coverage)
-                < 1e-10,
+            self.assertTrue(np.allclose(
+                special.betainc(a, b, hi) - special.betainc(a, b, lo),
+                coverage,
+                rtol=0.,
+                atol=1e-10,
             ))
             self.assertTrue(np.all(
                 (lo <= mode) & (hi >= mode),
@@ -527,13 +637,13 @@ class BetaHighestDensityIntervalTestCase(testcases.RandomTestCase):
             self.assertTrue(np.any(
                 (equal_tailed_hi - equal_tailed_lo) - (hi - lo) > 1e-5,
             ))
-        #   when coverage is an array.
+        # Test when coverage is an array.
         coverage = self.generator.random(size=(n, m))
         lo, hi = utils.beta_highest_density_interval(a, b, coverage)
         self.assertEqual(lo.shape, (n, m))
         self.assertEqual(hi.shape, (n, m))
         self.assertTrue(np.allclose(
-            beta.cdf(hi) - beta.cdf(lo),
+            special.betainc(a, b, hi) - special.betainc(a, b, lo),
             coverage,
         ))
         self.assertTrue(np.all(
@@ -547,20 +657,22 @@ class BetaHighestDensityIntervalTestCase(testcases.RandomTestCase):
         self.assertTrue(np.any(
             (equal_tailed_hi - equal_tailed_lo) - (hi - lo) > 1e-5,
         ))
-        # Test when a and b broadcast over each other.
+
+    def test_beta_highest_density_interval_when_a_and_b_broadcast(self):
         n, m = 5, 2
         a = np.arange(1, n + 1).reshape(n, 1)
         b = np.arange(m + 1, 1, -1).reshape(1, m)
         mode = (a - 1) / (a + b - 2)
-        beta = stats.beta(a, b)
-        #   when coverage is a scalar.
+        # Test when coverage is a scalar.
         for coverage in [0.25, 0.50, 0.75]:
             lo, hi = utils.beta_highest_density_interval(a, b, coverage)
             self.assertEqual(lo.shape, (n, m))
             self.assertEqual(hi.shape, (n, m))
-            self.assertTrue(np.all(
-                np.abs((beta.cdf(hi) - beta.cdf(lo)) - coverage)
-                < 1e-10,
+            self.assertTrue(np.allclose(
+                special.betainc(a, b, hi) - special.betainc(a, b, lo),
+                coverage,
+                rtol=0.,
+                atol=1e-10,
             ))
             self.assertTrue(np.all(
                 (lo <= mode) & (hi >= mode),
@@ -573,13 +685,13 @@ class BetaHighestDensityIntervalTestCase(testcases.RandomTestCase):
             self.assertTrue(np.any(
                 (equal_tailed_hi - equal_tailed_lo) - (hi - lo) > 1e-5,
             ))
-        #   when coverage is an array.
+        # Test when coverage is an array.
         coverage = self.generator.random(size=(n, m))
         lo, hi = utils.beta_highest_density_interval(a, b, coverage)
         self.assertEqual(lo.shape, (n, m))
         self.assertEqual(hi.shape, (n, m))
         self.assertTrue(np.allclose(
-            beta.cdf(hi) - beta.cdf(lo),
+            special.betainc(a, b, hi) - special.betainc(a, b, lo),
             coverage,
         ))
         self.assertTrue(np.all(
@@ -593,21 +705,21 @@ class BetaHighestDensityIntervalTestCase(testcases.RandomTestCase):
         self.assertTrue(np.any(
             (equal_tailed_hi - equal_tailed_lo) - (hi - lo) > 1e-5,
         ))
-        # Test when coverage broadcasts over a and b.
-        #   when a and b have the same shape.
+
+    def test_beta_highest_density_interval_when_coverage_broadcasts(self):
+        # Test when a and b have the same shape.
         n = 10
         a = np.arange(1, n + 1)[:, None]
         b = np.arange(n + 1, 1, -1)[:, None]
         mode = (a - 1) / (a + b - 2)
-        beta = stats.beta(a, b)
         k = 5
         coverage = self.generator.random(size=k)[None, :]
         lo, hi = utils.beta_highest_density_interval(a, b, coverage)
         self.assertEqual(lo.shape, (n, k))
         self.assertEqual(hi.shape, (n, k))
         self.assertTrue(np.allclose(
-            beta.cdf(hi) - beta.cdf(lo),
-            np.tile(coverage, (n, 1)),
+            special.betainc(a, b, hi) - special.betainc(a, b, lo),
+            coverage,
         ))
         self.assertTrue(np.all(
             (lo <= mode) & (hi >= mode),
@@ -620,20 +732,19 @@ class BetaHighestDensityIntervalTestCase(testcases.RandomTestCase):
         self.assertTrue(np.any(
             (equal_tailed_hi - equal_tailed_lo) - (hi - lo) > 1e-5,
         ))
-        #   when a and b broadcast over each other.
+        # Test when a and b broadcast over each other.
         n, m = 3, 2
         a = np.arange(1, n + 1).reshape(n, 1)[..., None]
         b = np.arange(m + 1, 1, -1).reshape(1, m)[..., None]
         mode = (a - 1) / (a + b - 2)
-        beta = stats.beta(a, b)
         k = 5
         coverage = self.generator.random(size=k)[None, None, :]
         lo, hi = utils.beta_highest_density_interval(a, b, coverage)
         self.assertEqual(lo.shape, (n, m, k))
         self.assertEqual(hi.shape, (n, m, k))
         self.assertTrue(np.allclose(
-            beta.cdf(hi) - beta.cdf(lo),
-            np.tile(coverage, (n, m, 1)),
+            special.betainc(a, b, hi) - special.betainc(a, b, lo),
+            coverage,
         ))
         self.assertTrue(np.all(
             (lo <= mode) & (hi >= mode),
@@ -649,25 +760,23 @@ class BetaHighestDensityIntervalTestCase(testcases.RandomTestCase):
 
     @pytest.mark.level(1)
     def test_on_small_confidences(self):
-        for coverage in [1e-8, 1e-12, 1e-16]:
-            for a in [1., 5., 10.]:
-                for b in [1., 5., 10.]:
-                    if a == 1 and b == 1:
-                        # No highest density interval exists when
-                        # a <= 1 and b <= 1.
-                        continue
-                    mode = (a - 1) / (a + b - 2)
-                    beta = stats.beta(a, b)
-                    lo, hi = utils.beta_highest_density_interval(a, b, coverage)
-                    self.assertEqual(lo.shape, ())
-                    self.assertEqual(hi.shape, ())
-                    self.assertLessEqual(lo, hi)
-                    self.assertAlmostEqual(
-                        beta.cdf(hi) - beta.cdf(lo),
-                        coverage,
-                    )
-                    self.assertLessEqual(lo, mode)
-                    self.assertGreaterEqual(hi, mode)
+        a, b = _beta_parameters([1., 5., 10.], ndim=2, highest_density=True)
+        n_ab = len(a)
+        mode = (a - 1) / (a + b - 2)
+        coverage = np.array([1e-8, 1e-12, 1e-16])[None, :]
+        lo, hi = utils.beta_highest_density_interval(a, b, coverage)
+        self.assertEqual(lo.shape, (n_ab, 3))
+        self.assertEqual(hi.shape, (n_ab, 3))
+        self.assertTrue(np.all(lo <= hi))
+        self.assertTrue(np.allclose(
+            special.betainc(a, b, hi) - special.betainc(a, b, lo),
+            coverage,
+            rtol=0.,
+            atol=5e-8,
+        ))
+        self.assertTrue(np.all(
+            (lo <= mode) & (hi >= mode),
+        ))
 
     def test_on_zero_coverage(self):
         for a in [1., 5., 10.]:
@@ -676,7 +785,6 @@ class BetaHighestDensityIntervalTestCase(testcases.RandomTestCase):
                     # No highest density interval exists when a <= 1 and b <= 1.
                     continue
                 mode = (a - 1) / (a + b - 2)
-                beta = stats.beta(a, b)
                 lo, hi = utils.beta_highest_density_interval(a, b, 0.)
                 self.assertEqual(lo.shape, ())
                 self.assertEqual(hi.shape, ())
@@ -684,54 +792,134 @@ class BetaHighestDensityIntervalTestCase(testcases.RandomTestCase):
                 self.assertAlmostEqual(lo, hi)
                 self.assertAlmostEqual(lo, mode)
                 self.assertAlmostEqual(hi, mode)
-                self.assertAlmostEqual(beta.cdf(hi) - beta.cdf(lo), 0.)
+                self.assertAlmostEqual(
+                    special.betainc(a, b, hi) - special.betainc(a, b, lo),
+                    0.,
+                )
+
+    def test_on_quantiles_near_the_mode(self):
+        # NOTE: Some versions of scipy's special.betaincinv return 0 for
+        # certain probabilities at the mode, so check such a case.
+        a, b = 2.179210228345227, 1.4291332285107556
+        mode = (a - 1) / (a + b - 2)
+        for a_, b_, mode_ in [(a, b, mode), (b, a, 1 - mode)]:
+            lo, hi = utils.beta_highest_density_interval(a_, b_, 1.6e-16)
+            self.assertAlmostEqual(lo, mode_)
+            self.assertAlmostEqual(hi, mode_)
+
+    def test_on_large_coverages(self):
+        a, b = _beta_parameters(
+            [1., 5., 10., 50.], ndim=2, highest_density=True,
+        )
+        coverage = np.array([1 - 1e-4, 1 - 1e-8, 1 - 1e-12])[None, :]
+        lo, hi = utils.beta_highest_density_interval(a, b, coverage)
+        self.assertTrue(np.allclose(
+            1 - special.betainc(a, b, lo) - special.betainc(b, a, 1 - hi),
+            coverage,
+            rtol=0.,
+            atol=1e-10,
+        ))
+        # The interval's density should be equal at both endpoints.
+        log_density_lo = stats.beta(a, b).logpdf(lo)
+        log_density_hi = stats.beta(a, b).logpdf(hi)
+        is_interior = (lo > 0) & (hi < 1)
+        self.assertTrue(np.allclose(
+            log_density_lo[is_interior],
+            log_density_hi[is_interior],
+            atol=1e-4,
+        ))
+
+    def test_on_zero_atol(self):
+        a = self.generator.uniform(1.5, 10., size=(3, 5))
+        b = self.generator.uniform(1.5, 10., size=(3, 5))
+        coverage = self.generator.uniform(0., 1., size=(3, 5))
+        lo, hi = utils.beta_highest_density_interval(
+            a, b, coverage, atol=0.,
+        )
+        self.assertEqual(lo.shape, (3, 5))
+        self.assertEqual(hi.shape, (3, 5))
+        self.assertTrue(np.allclose(
+            special.betainc(a, b, hi) - special.betainc(a, b, lo),
+            coverage,
+            rtol=0.,
+            atol=1e-10,
+        ))
+
+    def test_on_float32_inputs(self):
+        a = self.generator.uniform(1.5, 10., size=(3, 5))
+        b = self.generator.uniform(1.5, 10., size=(3, 5))
+        coverage = self.generator.uniform(0., 1., size=(3, 5))
+        lo_32, hi_32 = utils.beta_highest_density_interval(
+            a.astype(np.float32),
+            b.astype(np.float32),
+            coverage.astype(np.float32),
+        )
+        lo_64, hi_64 = utils.beta_highest_density_interval(
+            a.astype(np.float32).astype(np.float64),
+            b.astype(np.float32).astype(np.float64),
+            coverage.astype(np.float32).astype(np.float64),
+        )
+        self.assertEqual(lo_32.dtype, np.float64)
+        self.assertEqual(hi_32.dtype, np.float64)
+        self.assertTrue(np.array_equal(lo_32, lo_64))
+        self.assertTrue(np.array_equal(hi_32, hi_64))
 
 
 class BetaEqualTailedCoverageTestCase(testcases.RandomTestCase):
     """Test opda.utils.beta_equal_tailed_coverage."""
 
-    def test_beta_equal_tailed_coverage(self):
-        x_lo, x_hi = 0.01, 0.99
-        # NOTE: These checks must use values of x between 0.01 and 0.99,
-        # otherwise they will spuriously fail. The reason is that these
-        # tests work by taking the coverage returned by
-        # beta_equal_tailed_coverage, constructing the equal-tailed
-        # interval with that coverage, and verifying that x is one of
-        # the endpoints. If x is too close to 0 or 1 and the beta
-        # distribution is highly concentrated, then x can change by a
-        # large amount *without* changing the coverage much. This
-        # happens because the distribution will have almost no
-        # probability density near the endpoints. This invalidates our
-        # testing strategy. Instead, we test when x is near the
-        # endpoints in a separate test (See
-        # test_when_interval_has_large_coverage on
-        # BetaEqualTailedCoverageTestCase).
-
-        # Test when a and b are scalars.
-        for a in [1., 2., 3.]:
-            for b in [1., 2., 3.]:
-                # when x is a scalar.
-                for x in [0.25, 0.50, 0.75]:
-                    coverage = utils.beta_equal_tailed_coverage(a, b, x)
-                    lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
-                    self.assertEqual(coverage.shape, ())
-                    self.assertTrue(np.all(
-                        np.isclose(lo, x) | np.isclose(hi, x),
-                    ))
-                # when x is an array.
-                k = 5
-                x = self.generator.uniform(x_lo, x_hi, size=k)
-                coverage = utils.beta_equal_tailed_coverage(a, b, x)
-                lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
-                self.assertEqual(coverage.shape, (k,))
-                self.assertTrue(np.all(
-                    np.isclose(lo, x) | np.isclose(hi, x),
-                ))
-        # Test when a and b are 1D arrays.
+    # NOTE: The randomized checks must use values of x between 0.01 and
+    # 0.99 (x_lo and x_hi), otherwise they will spuriously fail. The
+    # reason is that these tests work by taking the coverage returned by
+    # beta_equal_tailed_coverage, constructing the equal-tailed interval
+    # with that coverage, and verifying that x is one of the endpoints.
+    # If x is too close to 0 or 1 and the beta distribution is highly
+    # concentrated, then x can change by a large amount *without*
+    # changing the coverage much. This happens because the distribution
+    # will have almost no probability density near the endpoints. This
+    # invalidates our testing strategy. Instead, we test when x is near
+    # the endpoints in a separate test (See
+    # test_when_interval_has_large_coverage on
+    # BetaEqualTailedCoverageTestCase).
+    x_lo, x_hi = 0.01, 0.99
+
+    def test_beta_equal_tailed_coverage_when_a_and_b_are_scalars(self):
+        a, b = _beta_parameters([1., 2., 3.], ndim=2)
+        n_ab = len(a)
+        # Test when x is a scalar.
+        x = np.array([0.25, 0.50, 0.75])[None, :]
+        coverage = utils.beta_equal_tailed_coverage(a, b, x)
+        lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+        self.assertEqual(coverage.shape, (n_ab, 3))
+        self.assertTrue(np.all(
+            np.isclose(lo, x) | np.isclose(hi, x),
+        ))
+        for i, j in np.ndindex(n_ab, 3):
+            coverage_ij = utils.beta_equal_tailed_coverage(
+                a[i, 0], b[i, 0], x[0, j],
+            )
+            self.assertEqual(coverage_ij.shape, ())
+            self.assertAlmostEqual(coverage_ij, coverage[i, j])
+        # Test when x is an array.
+        k = 5
+        x = self.generator.uniform(self.x_lo, self.x_hi, size=(n_ab, k))
+        coverage = utils.beta_equal_tailed_coverage(a, b, x)
+        lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+        self.assertEqual(coverage.shape, (n_ab, k))
+        self.assertTrue(np.all(
+            np.isclose(lo, x) | np.isclose(hi, x),
+        ))
+        for i in range(n_ab):
+            coverage_i =\
+                utils.beta_equal_tailed_coverage(a[i, 0], b[i, 0], x[i])
+            self.assertEqual(coverage_i.shape, (k,))
+            self.assertTrue(np.allclose(coverage_i, coverage[i]))
+
+    def test_beta_equal_tailed_coverage_when_a_and_b_are_1d_arrays(self):
         n = 3
         a = np.arange(1, n + 1)
         b = np.arange(n + 1, 1, -1)
-        #   when x is a scalar.
+        # Test when x is a scalar.
         for x in [0.25, 0.50, 0.75]:
             coverage = utils.beta_equal_tailed_coverage(a, b, x)
             lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
@@ -739,19 +927,20 @@ class BetaEqualTailedCoverageTestCase(testcases.RandomTestCase):
             self.assertTrue(np.all(
                 np.isclose(lo, x) | np.isclose(hi, x),
             ))
-        #   when x is an array.
-        x = self.generator.uniform(x_lo, x_hi, size=n)
+        # Test when x is an array.
+        x = self.generator.uniform(self.x_lo, self.x_hi, size=n)
         coverage = utils.beta_equal_tailed_coverage(a, b, x)
         lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
         self.assertEqual(coverage.shape, (n,))
         self.assertTrue(np.all(
             np.isclose(lo, x) | np.isclose(hi, x),
         ))
-        # Test when a and b are 2D arrays.
+
+    def test_beta_equal_tailed_coverage_when_a_and_b_are_2d_arrays(self):
         n, m = 3, 2
         a = np.arange(1, n * m + 1).reshape(n, m)
         b = np.arange(n * m + 1, 1, -1).reshape(n, m)
-        #   when x is a scalar.
+        # Test when x is a scalar.
         for x in [0.25, 0.50, 0.75]:
             coverage = utils.beta_equal_tailed_coverage(a, b, x)
             lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
@@ -759,19 +948,20 @@ class BetaEqualTailedCoverageTestCase(testcases.RandomTestCase):
             self.assertTrue(np.all(
                 np.isclose(lo, x) | np.isclose(hi, x),
             ))
-        #   when x is an array.
-        x = self.generator.uniform(x_lo, x_hi, size=(n, m))
+        # Test when x is an array.
+        x = self.generator.uniform(self.x_lo, self.x_hi, size=(n, m))
         coverage = utils.beta_equal_tailed_coverage(a, b, x)
         lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
         self.assertEqual(coverage.shape, (n, m))
         self.assertTrue(np.all(
             np.isclose(lo, x) | np.isclose(hi, x),
         ))
-        # Test when a and b broadcast over each other.
+
+    def test_beta_equal_tailed_coverage_when_a_and_b_broadcast(self):
         n, m = 3, 2
         a = np.arange(1, n + 1).reshape(n, 1)
         b = np.arange(m + 1, 1, -1).reshape(1, m)
-        #   when x is a scalar.
+        # Test when x is a scalar.
         for x in [0.25, 0.50, 0.75]:
             coverage = utils.beta_equal_tailed_coverage(a, b, x)
             lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
@@ -779,33 +969,34 @@ class BetaEqualTailedCoverageTestCase(testcases.RandomTestCase):
             self.assertTrue(np.all(
                 np.isclose(lo, x) | np.isclose(hi, x),
             ))
-        #   when x is an array.
-        x = self.generator.uniform(x_lo, x_hi, size=(n, m))
+        # Test when x is an array.
+        x = self.generator.uniform(self.x_lo, self.x_hi, size=(n, m))
         coverage = utils.beta_equal_tailed_coverage(a, b, x)
         lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
         self.assertEqual(coverage.shape, (n, m))
         self.assertTrue(np.all(
             np.isclose(lo, x) | np.isclose(hi, x),
         ))
-        # Test when x broadcasts over a and b.
-        #   when a and b have the same shape.
+
+    def test_beta_equal_tailed_coverage_when_x_broadcasts(self):
+        # Test when a and b have the same shape.
         n = 3
         a = np.arange(1, n + 1)[:, None]
         b = np.arange(n + 1, 1, -1)[:, None]
         k = 5
-        x = self.generator.uniform(x_lo, x_hi, size=(1, k))
+        x = self.generator.uniform(self.x_lo, self.x_hi, size=(1, k))
         coverage = utils.beta_equal_tailed_coverage(a, b, x)
         lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
         self.assertEqual(coverage.shape, (n, k))
         self.assertTrue(np.all(
             np.isclose(lo, x) | np.isclose(hi, x),
         ))
-        #   when a and b broadcast over each other.
+        # Test when a and b broadcast over each other.
         n, m = 3, 2
         a = np.arange(1, n + 1).reshape(n, 1)[..., None]
         b = np.arange(m + 1, 1, -1).reshape(1, m)[..., None]
         k = 5
-        x = self.generator.uniform(x_lo, x_hi, size=(1, 1, k))
+        x = self.generator.uniform(self.x_lo, self.x_hi, size=(1, 1, k))
         coverage = utils.beta_equal_tailed_coverage(a, b, x)
         lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
         self.assertEqual(coverage.shape, (n, m, k))
@@ -815,23 +1006,20 @@ class BetaEqualTailedCoverageTestCase(testcases.RandomTestCase):
 
     @pytest.mark.level(1)
     def test_when_interval_has_large_coverage(self):
-        for a in [1., 5., 10.]:
-            for b in [1., 5., 10.]:
-                for x_less_than_median in [False, True]:
-                    for eps in [1e-8, 1e-12, 1e-16]:
-                        x = (
-                            eps
-                            if x_less_than_median else
-                            1. - eps
-                        )
-                        coverage = utils.beta_equal_tailed_coverage(a, b, x)
-                        lo, hi =\
-                            utils.beta_equal_tailed_interval(a, b, coverage)
-                        self.assertEqual(coverage.shape, ())
-                        self.assertAlmostEqual(
-                            x,
-                            lo if x_less_than_median else hi,
-                        )
+        a = np.array([1., 5., 10.])[:, None, None, None]
+        b = np.array([1., 5., 10.])[None, :, None, None]
+        x_less_than_median = np.array([False, True])[:, None]
+        eps = np.array([1e-8, 1e-12, 1e-16])
+        x = np.where(x_less_than_median, eps, 1. - eps)
+        coverage = utils.beta_equal_tailed_coverage(a, b, x)
+        lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+        self.assertEqual(coverage.shape, (3, 3, 2, 3))
+        self.assertTrue(np.allclose(
+            x,
+            np.where(x_less_than_median, lo, hi),
+            rtol=0.,
+            atol=5e-8,
+        ))
 
     def test_when_x_is_on_the_boundary(self):
         for a in [1., 5., 10.]:
@@ -844,84 +1032,127 @@ class BetaEqualTailedCoverageTestCase(testcases.RandomTestCase):
 
     @pytest.mark.level(1)
     def test_when_interval_has_small_coverage(self):
-        for a in [1., 5., 10.]:
-            for b in [1., 5., 10.]:
-                median = stats.beta(a, b).ppf(0.5)
-                for x_less_than_median in [False, True]:
-                    for eps in [1e-8, 1e-12, 1e-16]:
-                        x = np.clip(
-                            median - eps
-                            if x_less_than_median else
-                            median + eps,
-                            0.,
-                            1.,
-                        )
-                        coverage = utils.beta_equal_tailed_coverage(a, b, x)
-                        lo, hi =\
-                            utils.beta_equal_tailed_interval(a, b, coverage)
-                        self.assertEqual(coverage.shape, ())
-                        self.assertAlmostEqual(
-                            x,
-                            lo if x_less_than_median else hi,
-                        )
+        a = np.array([1., 5., 10.])[:, None, None, None]
+        b = np.array([1., 5., 10.])[None, :, None, None]
+        median = special.betaincinv(a, b, 0.5)
+        x_less_than_median = np.array([False, True])[:, None]
+        eps = np.array([1e-8, 1e-12, 1e-16])
+        x = np.clip(
+            np.where(x_less_than_median, median - eps, median + eps),
+            0.,
+            1.,
+        )
+        coverage = utils.beta_equal_tailed_coverage(a, b, x)
+        lo, hi = utils.beta_equal_tailed_interval(a, b, coverage)
+        self.assertEqual(coverage.shape, (3, 3, 2, 3))
+        self.assertTrue(np.allclose(
+            x,
+            np.where(x_less_than_median, lo, hi),
+            rtol=0.,
+            atol=5e-8,
+        ))
 
     def test_when_interval_has_zero_coverage(self):
         for a in [1., 5., 10.]:
             for b in [1., 5., 10.]:
                 # Set x equal to the median.
-                x = stats.beta(a, b).ppf(0.5)
+                x = special.betaincinv(a, b, 0.5)
                 coverage = utils.beta_equal_tailed_coverage(a, b, x)
                 self.assertEqual(coverage.shape, ())
                 self.assertAlmostEqual(coverage, 0.)
 
+    def test_when_x_is_near_one(self):
+        # NOTE: When a = 1, the beta distribution's CDF has a closed form,
+        # so compare against that.
+        b = np.array([1., 5., 10.])[:, None]
+        x = 1. - np.array([1e-1, 1e-2, 1e-3, 1e-8, 1e-16])[None, :]
+        coverage = utils.beta_equal_tailed_coverage(1., b, x)
+        self.assertEqual(coverage.shape, (3, 5))
+        self.assertTrue(np.allclose(
+            coverage,
+            1. - 2 * (1. - x)**b,
+            rtol=0.,
+            atol=1e-15,
+        ))
+        # NOTE: When the tail beyond x is much smaller than float64's
+        # machine epsilon, the coverage should round to exactly 1.
+        a = b = np.array([3., 5., 10.])
+        coverage = utils.beta_equal_tailed_coverage(a, b, 1. - 1e-8)
+        self.assertTrue(np.all(coverage == 1.))
+
+    def test_on_float32_inputs(self):
+        a = self.generator.uniform(0.5, 10., size=(3, 5))
+        b = self.generator.uniform(0.5, 10., size=(3, 5))
+        x = self.generator.uniform(0., 1., size=(3, 5))
+        coverage_32 = utils.beta_equal_tailed_coverage(
+            a.astype(np.float32),
+            b.astype(np.float32),
+            x.astype(np.float32),
+        )
+        coverage_64 = utils.beta_equal_tailed_coverage(
+            a.astype(np.float32).astype(np.float64),
+            b.astype(np.float32).astype(np.float64),
+            x.astype(np.float32).astype(np.float64),
+        )
+        self.assertEqual(coverage_32.dtype, np.float64)
+        self.assertTrue(np.array_equal(coverage_32, coverage_64))
+
 
 class BetaHighestDensityCoverageTestCase(testcases.RandomTestCase):
     """Test opda.utils.beta_highest_density_coverage."""
 
-    def test_beta_highest_density_coverage(self):
-        x_lo, x_hi = 0.01, 0.99
-        # NOTE: These checks must use values of x between 0.01 and 0.99,
-        # otherwise they will spuriously fail. The reason is that these
-        # tests work by taking the coverage returned by
-        # beta_highest_density_coverage, constructing the highest
-        # density interval with that coverage, and verifying that x is
-        # one of the endpoints. If x is too close to 0 or 1 and the beta
-        # distribution is highly concentrated, then x can change by a
-        # large amount *without* changing the coverage much. This happens
-        # because the distribution will have almost no probability
-        # density near the endpoints. This invalidates our testing
-        # strategy. Instead, we test when x is near the endpoints in a
-        # separate test (See test_when_interval_has_large_coverage on
-        # BetaHighestDensityCoverageTestCase).
-
-        # Test when a and b are scalars.
-        for a in [1., 2., 3.]:
-            for b in [1., 2., 3.]:
-                if a == 1. and b == 1.:
-                    # No highest density interval exists when a <= 1 and b <= 1.
-                    continue
-                # when x is a scalar.
-                for x in [0.25, 0.50, 0.75]:
-                    coverage = utils.beta_highest_density_coverage(a, b, x)
-                    lo, hi = utils.beta_highest_density_interval(a, b, coverage)
-                    self.assertEqual(coverage.shape, ())
-                    self.assertTrue(np.all(
-                        np.isclose(lo, x) | np.isclose(hi, x),
-                    ))
-                # when x is an array.
-                k = 5
-                x = self.generator.uniform(x_lo, x_hi, size=k)
-                coverage = utils.beta_highest_density_coverage(a, b, x)
-                lo, hi = utils.beta_highest_density_interval(a, b, coverage)
-                self.assertEqual(coverage.shape, (k,))
-                self.assertTrue(np.all(
-                    np.isclose(lo, x) | np.isclose(hi, x),
-                ))
-        # Test when a and b are 1D arrays.
+    # NOTE: The randomized checks must use values of x between 0.01 and
+    # 0.99 (x_lo and x_hi), otherwise they will spuriously fail. The
+    # reason is that these tests work by taking the coverage returned by
+    # beta_highest_density_coverage, constructing the highest density
+    # interval with that coverage, and verifying that x is one of the
+    # endpoints. If x is too close to 0 or 1 and the beta distribution
+    # is highly concentrated, then x can change by a large amount
+    # *without* changing the coverage much. This happens because the
+    # distribution will have almost no probability density near the
+    # endpoints. This invalidates our testing strategy. Instead, we test
+    # when x is near the endpoints in a separate test (See
+    # test_when_interval_has_large_coverage on
+    # BetaHighestDensityCoverageTestCase).
+    x_lo, x_hi = 0.01, 0.99
+
+    def test_beta_highest_density_coverage_when_a_and_b_are_scalars(self):
+        a, b = _beta_parameters([1., 2., 3.], ndim=2, highest_density=True)
+        n_ab = len(a)
+        # Test when x is a scalar.
+        x = np.array([0.25, 0.50, 0.75])[None, :]
+        coverage = utils.beta_highest_density_coverage(a, b, x)
+        lo, hi = utils.beta_highest_density_interval(a, b, coverage)
+        self.assertEqual(coverage.shape, (n_ab, 3))
+        self.assertTrue(np.all(
+            np.isclose(lo, x) | np.isclose(hi, x),
+        ))
+        for i, j in np.ndindex(n_ab, 3):
+            coverage_ij = utils.beta_highest_density_coverage(
+                a[i, 0], b[i, 0], x[0, j],
+            )
+            self.assertEqual(coverage_ij.shape, ())
+            self.assertAlmostEqual(coverage_ij, coverage[i, j])
+        # Test when x is an array.
+        k = 5
+        x = self.generator.uniform(self.x_lo, self.x_hi, size=(n_ab, k))
+        coverage = utils.beta_highest_density_coverage(a, b, x)
+        lo, hi = utils.beta_highest_density_interval(a, b, coverage)
+        self.assertEqual(coverage.shape, (n_ab, k))
+        self.assertTrue(np.all(
+            np.isclose(lo, x) | np.isclose(hi, x),
+        ))
+        for i in range(n_ab):
+            coverage_i =\
+                utils.beta_highest_density_coverage(a[i, 0], b[i, 0], x[i])
+            self.assertEqual(coverage_i.shape, (k,))
+            self.assertTrue(np.allclose(coverage_i, coverage[i]))
+
+    def test_beta_highest_density_coverage_when_a_and_b_are_1d_arrays(self):
         n = 3
         a = np.arange(1, n + 1)
         b = np.arange(n + 1, 1, -1)
-        #   when x is a scalar.
+        # Test when x is a scalar.
         for x in [0.25, 0.50, 0.75]:
             coverage = utils.beta_highest_density_coverage(a, b, x)
             lo, hi = utils.beta_highest_density_interval(a, b, coverage)
@@ -929,19 +1160,20 @@ class BetaHighestDensityCoverageTestCase(testcases.RandomTestCase):
             self.assertTrue(np.all(
                 np.isclose(lo, x) | np.isclose(hi, x),
             ))
-        #   when x is an array.
-        x = self.generator.uniform(x_lo, x_hi, size=n)
+        # Test when x is an array.
+        x = self.generator.uniform(self.x_lo, self.x_hi, size=n)
         coverage = utils.beta_highest_density_coverage(a, b, x)
         lo, hi = utils.beta_highest_density_interval(a, b, coverage)
         self.assertEqual(coverage.shape, (n,))
         self.assertTrue(np.all(
             np.isclose(lo, x) | np.isclose(hi, x),
         ))
-        # Test when a and b are 2D arrays.
+
+    def test_beta_highest_density_coverage_when_a_and_b_are_2d_arrays(self):
         n, m = 3, 2
         a = np.arange(1, n * m + 1).reshape(n, m)
         b = np.arange(n * m + 1, 1, -1).reshape(n, m)
-        #   when x is a scalar.
+        # Test when x is a scalar.
         for x in [0.25, 0.50, 0.75]:
             coverage = utils.beta_highest_density_coverage(a, b, x)
             lo, hi = utils.beta_highest_density_interval(a, b, coverage)
@@ -949,19 +1181,20 @@ class BetaHighestDensityCoverageTestCase(testcases.RandomTestCase):
             self.assertTrue(np.all(
                 np.isclose(lo, x) | np.isclose(hi, x),
             ))
-        #   when x is an array.
-        x = self.generator.uniform(x_lo, x_hi, size=(n, m))
+        # Test when x is an array.
+        x = self.generator.uniform(self.x_lo, self.x_hi, size=(n, m))
         coverage = utils.beta_highest_density_coverage(a, b, x)
         lo, hi = utils.beta_highest_density_interval(a, b, coverage)
         self.assertEqual(coverage.shape, (n, m))
         self.assertTrue(np.all(
             np.isclose(lo, x) | np.isclose(hi, x),
         ))
-        # Test when a and b broadcast over each other.
+
+    def test_beta_highest_density_coverage_when_a_and_b_broadcast(self):
         n, m = 3, 2
         a = np.arange(1, n + 1).reshape(n, 1)
         b = np.arange(m + 1, 1, -1).reshape(1, m)
-        #   when x is a scalar.
+        # Test when x is a scalar.
         for x in [0.25, 0.50, 0.75]:
             coverage = utils.beta_highest_density_coverage(a, b, x)
             lo, hi = utils.beta_highest_density_interval(a, b, coverage)
@@ -969,33 +1202,34 @@ class BetaHighestDensityCoverageTestCase(testcases.RandomTestCase):
             self.assertTrue(np.all(
                 np.isclose(lo, x) | np.isclose(hi, x),
             ))
-        #   when x is an array.
-        x = self.generator.uniform(x_lo, x_hi, size=(n, m))
+        # Test when x is an array.
+        x = self.generator.uniform(self.x_lo, self.x_hi, size=(n, m))
         coverage = utils.beta_highest_density_coverage(a, b, x)
         lo, hi = utils.beta_highest_density_interval(a, b, coverage)
         self.assertEqual(coverage.shape, (n, m))
         self.assertTrue(np.all(
             np.isclose(lo, x) | np.isclose(hi, x),
         ))
-        # Test when x broadcasts over a and b.
-        #   when a and b have the same shape.
+
+    def test_beta_highest_density_coverage_when_x_broadcasts(self):
+        # Test when a and b have the same shape.
         n = 3
         a = np.arange(1, n + 1)[:, None]
         b = np.arange(n + 1, 1, -1)[:, None]
         k = 5
-        x = self.generator.uniform(x_lo, x_hi, size=(1, k))
+        x = self.generator.uniform(self.x_lo, self.x_hi, size=(1, k))
         coverage = utils.beta_highest_density_coverage(a, b, x)
         lo, hi = utils.beta_highest_density_interval(a, b, coverage)
         self.assertEqual(coverage.shape, (n, k))
         self.assertTrue(np.all(
             np.isclose(lo, x) | np.isclose(hi, x),
         ))
-        #   when a and b broadcast over each other.
+        # Test when a and b broadcast over each other.
         n, m = 3, 2
         a = np.arange(1, n + 1).reshape(n, 1)[..., None]
         b = np.arange(m + 1, 1, -1).reshape(1, m)[..., None]
         k = 5
-        x = self.generator.uniform(x_lo, x_hi, size=(1, 1, k))
+        x = self.generator.uniform(self.x_lo, self.x_hi, size=(1, 1, k))
         coverage = utils.beta_highest_density_coverage(a, b, x)
         lo, hi = utils.beta_highest_density_interval(a, b, coverage)
         self.assertEqual(coverage.shape, (n, m, k))
@@ -1005,26 +1239,20 @@ class BetaHighestDensityCoverageTestCase(testcases.RandomTestCase):
 
     @pytest.mark.level(1)
     def test_when_interval_has_large_coverage(self):
-        for a in [1., 5., 10.]:
-            for b in [1., 5., 10.]:
-                if a == 1 and b == 1:
-                    # No highest density interval exists when a <= 1 and b <= 1.
-                    continue
-                for x_less_than_mode in [False, True]:
-                    for eps in [1e-8, 1e-12, 1e-16]:
-                        x = (
-                            eps
-                            if x_less_than_mode else
-                            1. - eps
-                        )
-                        coverage = utils.beta_highest_density_coverage(a, b, x)
-                        lo, hi =\
-                            utils.beta_highest_density_interval(a, b, coverage)
-                        self.assertEqual(coverage.shape, ())
-                        self.assertAlmostEqual(
-                            x,
-                            lo if x_less_than_mode else hi,
-                        )
+        a, b = _beta_parameters([1., 5., 10.], ndim=3, highest_density=True)
+        n_ab = len(a)
+        x_less_than_mode = np.array([False, True])[:, None]
+        eps = np.array([1e-8, 1e-12, 1e-16])
+        x = np.where(x_less_than_mode, eps, 1. - eps)
+        coverage = utils.beta_highest_density_coverage(a, b, x)
+        lo, hi = utils.beta_highest_density_interval(a, b, coverage)
+        self.assertEqual(coverage.shape, (n_ab, 2, 3))
+        self.assertTrue(np.allclose(
+            x,
+            np.where(x_less_than_mode, lo, hi),
+            rtol=0.,
+            atol=5e-8,
+        ))
 
     def test_when_x_is_on_the_boundary(self):
         for a in [1., 5., 10.]:
@@ -1044,29 +1272,25 @@ class BetaHighestDensityCoverageTestCase(testcases.RandomTestCase):
 
     @pytest.mark.level(1)
     def test_when_interval_has_small_coverage(self):
-        for a in [1., 5., 10.]:
-            for b in [1., 5., 10.]:
-                if a == 1 and b == 1:
-                    # No highest density interval exists when a <= 1 and b <= 1.
-                    continue
-                mode = (a - 1) / (a + b - 2)
-                for x_less_than_mode in [False, True]:
-                    for eps in [1e-8, 1e-12, 1e-16]:
-                        x = np.clip(
-                            mode - eps
-                            if x_less_than_mode else
-                            mode + eps,
-                            0.,
-                            1.,
-                        )
-                        coverage = utils.beta_highest_density_coverage(a, b, x)
-                        lo, hi =\
-                            utils.beta_highest_density_interval(a, b, coverage)
-                        self.assertEqual(coverage.shape, ())
-                        self.assertAlmostEqual(
-                            x,
-                            lo if x_less_than_mode else hi,
-                        )
+        a, b = _beta_parameters([1., 5., 10.], ndim=3, highest_density=True)
+        n_ab = len(a)
+        mode = (a - 1) / (a + b - 2)
+        x_less_than_mode = np.array([False, True])[:, None]
+        eps = np.array([1e-8, 1e-12, 1e-16])
+        x = np.clip(
+            np.where(x_less_than_mode, mode - eps, mode + eps),
+            0.,
+            1.,
+        )
+        coverage = utils.beta_highest_density_coverage(a, b, x)
+        lo, hi = utils.beta_highest_density_interval(a, b, coverage)
+        self.assertEqual(coverage.shape, (n_ab, 2, 3))
+        self.assertTrue(np.allclose(
+            x,
+            np.where(x_less_than_mode, lo, hi),
+            rtol=0.,
+            atol=5e-8,
+        ))
 
     def test_when_interval_has_zero_coverage(self):
         for a in [1., 5., 10.]:
@@ -1080,37 +1304,95 @@ class BetaHighestDensityCoverageTestCase(testcases.RandomTestCase):
                 self.assertEqual(coverage.shape, ())
                 self.assertAlmostEqual(coverage, 0.)
 
+    def test_on_float32_inputs(self):
+        a = self.generator.uniform(1.5, 10., size=(3, 5))
+        b = self.generator.uniform(1.5, 10., size=(3, 5))
+        x = self.generator.uniform(0., 1., size=(3, 5))
+        # Test that float32 inputs return double precision by default.
+        coverage = utils.beta_highest_density_coverage(
+            a.astype(np.float32),
+            b.astype(np.float32),
+            x.astype(np.float32),
+        )
+        self.assertEqual(coverage.dtype, np.float64)
+        self.assertTrue(np.array_equal(
+            coverage,
+            utils.beta_highest_density_coverage(
+                a.astype(np.float32).astype(np.float64),
+                b.astype(np.float32).astype(np.float64),
+                x.astype(np.float32).astype(np.float64),
+            ),
+        ))
+        # Test computing in single precision.
+        coverage_32 = utils.beta_highest_density_coverage(
+            a, b, x, dtype=np.float32,
+        )
+        coverage_64 = utils.beta_highest_density_coverage(a, b, x)
+        self.assertEqual(coverage_32.dtype, np.float32)
+        self.assertEqual(coverage_32.shape, (3, 5))
+        # NOTE: Near the mode, the density is flat so single precision
+        # can't pin down the other end of the interval as accurately.
+        # Thus, the coverages can differ by much more than float32's
+        # machine epsilon.
+        self.assertTrue(np.allclose(coverage_32, coverage_64, atol=1e-3))
+
 
 class BinomialConfidenceIntervalTestCase(unittest.TestCase):
     """Test opda.utils.binomial_confidence_interval."""
 
     def test_binomial_confidence_interval(self):
-        for n_successes, n_total, confidence, (lo_expected, hi_expected) in [
-                # n_total == 1
-                ( 0,  1, 0.0, (0.0000, 0.5000)),
-                ( 0,  1, 0.5, (0.0000, 0.7500)),
-                ( 0,  1, 1.0, (0.0000, 1.0000)),
-                ( 1,  1, 0.0, (0.5000, 1.0000)),
-                ( 1,  1, 0.5, (0.2500, 1.0000)),
-                ( 1,  1, 1.0, (0.0000, 1.0000)),
-                # n_successes == 0
-                ( 0, 10, 0.0, (0.0000, 0.0670)),
-                ( 0, 10, 0.5, (0.0000, 0.1295)),
-                ( 0, 10, 1.0, (0.0000, 1.0000)),
-                # 0 < n_successes < n_total
-                ( 5, 10, 0.0, (0.4517, 0.5483)),
-                ( 5, 10, 0.5, (0.3507, 0.6493)),
-                ( 5, 10, 1.0, (0.0000, 1.0000)),
-                # n_successes == n_total
-                (10, 10, 0.0, (0.9330, 1.0000)),
-                (10, 10, 0.5, (0.8705, 1.0000)),
-                (10, 10, 1.0, (0.0000, 1.0000)),
-        ]:
+        # NOTE: Check every row both with one vectorized call and with
+        # scalar inputs, one call per row.
+        rows = [
+            # n_total == 1
+            ( 0,  1, 0.0, (0.0000, 0.5000)),
+            ( 0,  1, 0.5, (0.0000, 0.7500)),
+            ( 0,  1, 1.0, (0.0000, 1.0000)),
+            ( 1,  1, 0.0, (0.5000, 1.0000)),
+            ( 1,  1, 0.5, (0.2500, 1.0000)),
+            ( 1,  1, 1.0, (0.0000, 1.0000)),
+            # n_successes == 0
+            ( 0, 10, 0.0, (0.0000, 0.0670)),
+            ( 0, 10, 0.5, (0.0000, 0.1295)),
+            ( 0, 10, 1.0, (0.0000, 1.0000)),
+            # 0 < n_successes < n_total
+            ( 5, 10, 0.0, (0.4517, 0.5483)),
+            ( 5, 10, 0.5, (0.3507, 0.6493)),
+            ( 5, 10, 1.0, (0.0000, 1.0000)),
+            # n_successes == n_total
+            (10, 10, 0.0, (0.9330, 1.0000)),
+            (10, 10, 0.5, (0.8705, 1.0000)),
+            (10, 10, 1.0, (0.0000, 1.0000)),
+        ]
+        n_successes, n_total, confidence, expected = zip(*rows)
+        lo_expected, hi_expected = np.array(expected).T
+        lo_actual, hi_actual = utils.binomial_confidence_interval(
+            n_successes, n_total, confidence,
+        )
+        self.assertEqual(lo_actual.shape, (len(rows),))
+        self.assertEqual(hi_actual.shape, (len(rows),))
+        self.assertTrue(np.allclose(
+            lo_actual,
+            lo_expected,
+            rtol=0.,
+            atol=5e-4,
+        ))
+        self.assertTrue(np.allclose(
+            hi_actual,
+            hi_expected,
+            rtol=0.,
+            atol=5e-4,
+        ))
+        # NOTE: Scalar inputs fix the degenerate bounds on 0-d arrays, so
+        # check them separately.
+        for n_successes_, n_total_, confidence_, (lo_, hi_) in rows:
             lo_actual, hi_actual = utils.binomial_confidence_interval(
-                n_successes, n_total, confidence,
+                n_successes_, n_total_, confidence_,
             )
-            self.assertAlmostEqual(lo_actual, lo_expected, places=3)
-            self.assertAlmostEqual(hi_actual, hi_expected, places=3)
+            self.assertEqual(lo_actual.shape, ())
+            self.assertEqual(hi_actual.shape, ())
+            self.assertAlmostEqual(lo_actual, lo_, delta=5e-4)
+            self.assertAlmostEqual(hi_actual, hi_, delta=5e-4)
 
     def test_binomial_confidence_interval_broadcasts(self):
         # 1D array x scalar x scalar
@@ -1120,13 +1402,11 @@ class BinomialConfidenceIntervalTestCase(unittest.TestCase):
             confidence=0.5,
         )
         self.assertTrue(np.allclose(
-            lo,
-            [0.0000, 0.3507, 0.8705],
-            atol=5e-4,
-        ))
-        self.assertTrue(np.allclose(
-            hi,
-            [0.1295, 0.6493, 1.0000],
+            [lo, hi],
+            [
+                [0.0000, 0.3507, 0.8705],
+                [0.1295, 0.6493, 1.0000],
+            ],
             atol=5e-4,
         ))
         # scalar x 1D array x scalar
@@ -1136,13 +1416,11 @@ class BinomialConfidenceIntervalTestCase(unittest.TestCase):
             confidence=0.5,
         )
         self.assertTrue(np.allclose(
-            lo,
-            [0.0000, 0.0000],
-            atol=5e-4,
-        ))
-        self.assertTrue(np.allclose(
-            hi,
-            [0.7500, 0.1295],
+            [lo, hi],
+            [
+                [0.0000, 0.0000],
+                [0.7500, 0.1295],
+            ],
             atol=5e-4,
         ))
         # scalar x scalar x 1D array
@@ -1152,33 +1430,70 @@ class BinomialConfidenceIntervalTestCase(unittest.TestCase):
             confidence=[0.0, 0.5, 1.0],
         )
         self.assertTrue(np.allclose(
-            lo,
-            [0.4517, 0.3507, 0.0000],
+            [lo, hi],
+            [
+                [0.4517, 0.3507, 0.0000],
+                [0.5483, 0.6493, 1.0000],
+            ],
             atol=5e-4,
         ))
+
+    def test_on_high_confidences(self):
+        # NOTE: When n_successes is 0 or n_total, the Clopper-Pearson
+        # bounds have closed forms, so compare against those.
+        n_total = 20
+        confidence = np.array([1. - 1e-5, 1. - 1e-10, 1. - 1e-15])
+        alpha_half = (1. - confidence) / 2.
+        #   when n_successes is 0.
+        lo, hi = utils.binomial_confidence_interval(0, n_total, confidence)
+        self.assertTrue(np.all(lo == 0.))
         self.assertTrue(np.allclose(
             hi,
-            [0.5483, 0.6493, 1.0000],
-            atol=5e-4,
+            1. - alpha_half**(1 / n_total),
+            rtol=0.,
+            atol=1e-12,
+        ))
+        #   when n_successes is n_total.
+        lo, hi = utils.binomial_confidence_interval(
+            n_total, n_total, confidence,
+        )
+        self.assertTrue(np.allclose(
+            lo,
+            alpha_half**(1 / n_total),
+            rtol=0.,
+            atol=1e-12,
         ))
+        self.assertTrue(np.all(hi == 1.))
 
     @pytest.mark.level(1)
     def test_binomial_confidence_interval_is_symmetric(self):
-        for n_successes, n_total in [
-                (  0,   1),
-                (  0, 100),
-                ( 25, 100),
-                ( 50, 100),
-        ]:
-            for confidence in [0.00, 0.25, 0.50, 0.75, 1.00]:
-                lo1, hi1 = utils.binomial_confidence_interval(
-                    n_successes, n_total, confidence,
-                )
-                lo2, hi2 = utils.binomial_confidence_interval(
-                    n_total - n_successes, n_total, confidence,
-                )
-                self.assertAlmostEqual(lo1, 1 - hi2)
-                self.assertAlmostEqual(hi1, 1 - lo2)
+        n_successes, n_total = np.array([
+            (  0,   1),
+            (  0, 100),
+            ( 25, 100),
+            ( 50, 100),
+        ]).T[:, :, None]
+        confidence = np.array([0.00, 0.25, 0.50, 0.75, 1.00])[None, :]
+        lo1, hi1 = utils.binomial_confidence_interval(
+            n_successes, n_total, confidence,
+        )
+        lo2, hi2 = utils.binomial_confidence_interval(
+            n_total - n_successes, n_total, confidence,
+        )
+        self.assertEqual(lo1.shape, (4, 5))
+        self.assertEqual(hi1.shape, (4, 5))
+        self.assertTrue(np.allclose(
+            lo1,
+            1 - hi2,
+            rtol=0.,
+            atol=5e-8,
+        ))
+        self.assertTrue(np.allclose(
+            hi1,
+            1 - lo2,
+            rtol=0.,
+            atol=5e-8,
+        ))
 
 
 class NormalPdfTestCase(unittest.TestCase):